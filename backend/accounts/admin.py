@@ -1,13 +1,32 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
+from django.contrib.auth.forms import UserChangeForm, UserCreationForm
 from .models import User
 
 
+# Bind Django's user forms to the email-based model once, so there is no
+# username field to strip on each request.
+class EmailUserAdminForm(UserChangeForm):
+    class Meta(UserChangeForm.Meta):
+        model = User
+        fields = "__all__"
+
+
+class EmailUserAdminCreationForm(UserCreationForm):
+    class Meta(UserCreationForm.Meta):
+        model = User
+        fields = ("email",)
+
+
 @admin.register(User)
 class UserAdmin(DjangoUserAdmin):
     ordering = ("email",)
     list_display = ("email", "first_name", "last_name", "is_staff", "is_superuser", "is_active")
-    search_fields = ("email", "first_name", "last_name")
+    # Prefix matches ("^") can use an index, unlike the default contains search;
+    # this also drives bidder/donor autocompletes in the auctions admin.
+    search_fields = ("^email", "^first_name", "^last_name")
+    form = EmailUserAdminForm
+    add_form = EmailUserAdminCreationForm
 
     fieldsets = (
         (None, {"fields": ("email", "password")}),
@@ -31,9 +50,3 @@ class UserAdmin(DjangoUserAdmin):
 
     readonly_fields = ("last_login", "date_joined")
 
-    # Use email as the username field
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if hasattr(form, "base_fields") and "username" in form.base_fields:
-            form.base_fields.pop("username")
-        return form
@@ -0,0 +1,34 @@
+# Prefix index for admin user search/autocomplete.
+#
+# UserAdmin searches with "^email" (istartswith), which Postgres compiles to
+# UPPER(email::text) LIKE UPPER('term%'). A plain b-tree only serves LIKE under
+# the C collation, so this expression index uses text_pattern_ops. The opclass
+# is Postgres-specific, so other backends skip it.
+
+from django.db import migrations
+
+
+def create_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS user_email_prefix_idx "
+        "ON accounts_user ((UPPER(email::text)) text_pattern_ops)"
+    )
+
+
+def drop_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS user_email_prefix_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_user_upper_email_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
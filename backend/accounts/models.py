@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
@@ -53,6 +54,12 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [
+            # Backs case-insensitive lookups (email__iexact compiles to UPPER(email) = UPPER(%s))
+            models.Index(Upper("email"), name="upper_user_email_idx"),
+        ]
+
     def __str__(self):
         return self.email or "<user>"
 
@@ -1,10 +1,14 @@
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection, transaction
+from django.db.models import Q
 from django.urls import path
 from django.shortcuts import render, redirect
 from django.contrib import messages
-import os
 
 from .models import Auction, Category, Item, Bid, ProxyBid
+from .tasks import send_sms, send_test_sms
 
 
 @admin.register(Auction)
@@ -38,35 +42,21 @@ class AuctionAdmin(admin.ModelAdmin):
             if not to:
                 messages.error(request, "Destination 'to' is required (E.164 format)")
             else:
-                api_key = os.environ.get("TELNYX_API_KEY")
-                profile_id = os.environ.get("TELNYX_MESSAGING_PROFILE_ID")
-                from_number = os.environ.get("TELNYX_FROM_NUMBER")
-                if not api_key:
+                if not settings.TELNYX_API_KEY:
                     messages.error(request, "TELNYX_API_KEY is not configured")
-                elif not (profile_id or from_number):
+                elif not (settings.TELNYX_MESSAGING_PROFILE_ID or settings.TELNYX_FROM_NUMBER):
                     messages.error(
                         request, "TELNYX_MESSAGING_PROFILE_ID or TELNYX_FROM_NUMBER must be set"
                     )
+                elif settings.CELERY_ENABLED:
+                    # Hand the Telnyx round-trip to a worker instead of holding this request
+                    send_test_sms.delay(to, text)
+                    messages.success(request, f"Test SMS to {to} queued.")
+                    return redirect("admin:auctions_auction_send_test_sms")
                 else:
                     try:
-                        import telnyx
-
-                        telnyx.api_key = api_key
-                        if profile_id:
-                            msg = telnyx.Message.create(
-                                to=to,
-                                messaging_profile_id=profile_id,
-                                text=text,
-                            )
-                        else:
-                            msg = telnyx.Message.create(
-                                to=to,
-                                from_=from_number,
-                                text=text,
-                            )
-                        messages.success(
-                            request, f"Sent. Message ID: {getattr(msg, 'id', None) or 'unknown'}"
-                        )
+                        msg_id = send_sms(to, text)
+                        messages.success(request, f"Sent. Message ID: {msg_id or 'unknown'}")
                         return redirect("admin:auctions_auction_send_test_sms")
                     except Exception as e:
                         messages.error(request, f"Error sending SMS: {e}")
@@ -85,9 +75,26 @@ class CategoryAdmin(admin.ModelAdmin):
 class ItemAdmin(admin.ModelAdmin):
     list_display = ("title", "type", "auction", "category", "status", "quantity_total", "quantity_sold")
     list_filter = ("type", "status", "auction", "category")
-    search_fields = ("title", "slug", "description")
+    search_fields = ("title", "slug")
     autocomplete_fields = ("auction", "category", "donor")
     prepopulated_fields = {"slug": ("title",)}
+    list_select_related = ("auction", "category", "donor")
+    ordering = ("title",)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Match title/slug as usual, plus full-text search over the item text.
+
+        On Postgres the description/restrictions match goes through the
+        GIN-indexed search_vector instead of a LIKE scan over the text columns.
+        """
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if not search_term:
+            return results, may_have_duplicates
+        if connection.vendor == "postgresql":
+            text_match = Q(search_vector=SearchQuery(search_term, config=Item.SEARCH_CONFIG, search_type="websearch"))
+        else:
+            text_match = Q(description__icontains=search_term) | Q(restrictions__icontains=search_term)
+        return results | queryset.filter(text_match), may_have_duplicates
 
 
 class BidInline(admin.TabularInline):
@@ -96,6 +103,7 @@ class BidInline(admin.TabularInline):
     autocomplete_fields = ("bidder",)
     fields = ("bidder", "amount", "idempotency_key", "created_at")
     readonly_fields = ("created_at",)
+    ordering = ("-created_at",)
 
 
 class ProxyBidInline(admin.TabularInline):
@@ -106,25 +114,49 @@ class ProxyBidInline(admin.TabularInline):
     readonly_fields = ("created_at", "updated_at")
 
 
-# Attach inlines to Item admin for convenient per-item management
+# Attach inlines to Item admin for convenient per-item management. Saving the
+# change form UPDATEs the item row before its inlines, so proxy edits made
+# here already hold the Item lock that the bid views reprice under.
 ItemAdmin.inlines = [ProxyBidInline, BidInline]
 
 
+def _lock_items(item_ids):
+    """Take the Item row locks the bid views hold while repricing proxies."""
+    list(Item.objects.select_for_update().filter(pk__in=item_ids).order_by("pk").values_list("pk", flat=True))
+
+
 @admin.register(Bid)
 class BidAdmin(admin.ModelAdmin):
     list_display = ("item", "bidder", "amount", "created_at")
     list_filter = ("item",)
-    search_fields = ("item__title", "item__slug", "bidder__username", "bidder__email")
+    search_fields = ("^bidder__email",)
     autocomplete_fields = ("item", "bidder")
     date_hierarchy = "created_at"
     list_select_related = ("item", "bidder")
+    ordering = ("-created_at",)
 
 
 @admin.register(ProxyBid)
 class ProxyBidAdmin(admin.ModelAdmin):
     list_display = ("item", "bidder", "max_amount", "seats", "updated_at")
     list_filter = ("item",)
-    search_fields = ("item__title", "item__slug", "bidder__username", "bidder__email")
+    search_fields = ("^bidder__email",)
     autocomplete_fields = ("item", "bidder")
     date_hierarchy = "updated_at"
     list_select_related = ("item", "bidder")
+
+    # The bid views read an item's proxies under its Item lock without locking
+    # the proxy rows, so edits here must take that lock too. The admin runs
+    # save_model/delete_model inside its own transaction.
+    def save_model(self, request, obj, form, change):
+        _lock_items({obj.item_id, form.initial.get("item", obj.item_id)})
+        super().save_model(request, obj, form, change)
+
+    def delete_model(self, request, obj):
+        _lock_items([obj.item_id])
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            _lock_items(queryset.values("item_id"))
+            super().delete_queryset(request, queryset)
@@ -12,9 +12,24 @@ class EmailBackend(ModelBackend):
         if not email or not password:
             return None
         try:
-            user = User.objects.get(email__iexact=email)
+            # Only what the password check, login() and the session hash touch
+            user = User.objects.only("id", "email", "password", "is_active", "last_login").get(
+                email__iexact=email
+            )
         except User.DoesNotExist:
+            # Hash anyway, as ModelBackend does, so an unknown email takes as
+            # long as a wrong password and doesn't reveal which accounts exist
+            User().set_password(password)
             return None
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
         return None
+
+    def get_user(self, user_id):
+        # Sessions resolve request.user through here on every request; join the
+        # profile so the header avatar tag doesn't cost a second query.
+        try:
+            user = User._default_manager.select_related("profile").get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -1,18 +1,27 @@
+from functools import lru_cache
+
 from django import forms
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from decimal import Decimal
 from .models import Item, Profile
-from captcha.fields import ReCaptchaField
-from captcha.widgets import ReCaptchaV2Checkbox
 
 User = get_user_model()
 
 
+@lru_cache(maxsize=None)
+def _recaptcha_classes():
+    """Import the captcha field/widget on first use rather than at module load."""
+    from captcha.fields import ReCaptchaField
+    from captcha.widgets import ReCaptchaV2Checkbox
+
+    return ReCaptchaField, ReCaptchaV2Checkbox
+
+
 class RegisterForm(forms.ModelForm):
     password = forms.CharField(widget=forms.PasswordInput)
     password_confirm = forms.CharField(widget=forms.PasswordInput, label="Confirm password")
-    captcha = ReCaptchaField(widget=ReCaptchaV2Checkbox)
 
     class Meta:
         model = User
@@ -36,6 +45,10 @@ class RegisterForm(forms.ModelForm):
         self.fields["password_confirm"].widget = forms.PasswordInput(
             attrs={"placeholder": "Re-enter password"}
         )
+        # Only build the reCAPTCHA field where it is enabled (off in tests)
+        if getattr(settings, "ENABLE_RECAPTCHA", True):
+            field_cls, widget_cls = _recaptcha_classes()
+            self.fields["captcha"] = field_cls(widget=widget_cls)
 
     def clean_email(self):
         email = (self.cleaned_data.get("email") or "").strip().lower()
@@ -107,6 +120,16 @@ class EmailLoginForm(forms.Form):
         )
 
 
+# Donor form should NOT offer "Fixed Price Signup"; those are created in phase 2 by managers.
+_DONOR_TYPE_CHOICES = tuple(
+    (val, label) for (val, label) in Item.TYPE_CHOICES if val != Item.TYPE_FIXED_PRICE
+)
+# HTML5 datetime-local value format
+_DATETIME_LOCAL_FORMAT = "%Y-%m-%dT%H:%M"
+_BIDDING_TYPES = frozenset({Item.TYPE_GOOD, Item.TYPE_SERVICE, Item.TYPE_EVENT})
+_ZERO = Decimal(0)
+
+
 class DonorItemForm(forms.ModelForm):
     enable_buy_now = forms.BooleanField(
         required=False,
@@ -116,13 +139,8 @@ class DonorItemForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Donor form should NOT offer "Fixed Price Signup"; those are created in phase 2 by managers.
         try:
-            self.fields["type"].choices = [
-                (val, label)
-                for (val, label) in Item.TYPE_CHOICES
-                if val != Item.TYPE_FIXED_PRICE
-            ]
+            self.fields["type"].choices = _DONOR_TYPE_CHOICES
         except Exception:
             pass
 
@@ -130,18 +148,18 @@ class DonorItemForm(forms.ModelForm):
         for f in ("event_starts_at", "event_ends_at"):
             if f in self.fields:
                 self.fields[f].widget = forms.DateTimeInput(
-                    attrs={"type": "datetime-local"}, format="%Y-%m-%dT%H:%M"
+                    attrs={"type": "datetime-local"}, format=_DATETIME_LOCAL_FORMAT
                 )
                 # Accept HTML5 datetime-local value format
                 try:
-                    self.fields[f].input_formats = ["%Y-%m-%dT%H:%M"]
+                    self.fields[f].input_formats = [_DATETIME_LOCAL_FORMAT]
                 except Exception:
                     pass
                 # If initial value exists, ensure it renders in the widget's format
                 val = self.initial.get(f) or getattr(self.instance, f, None)
                 if val is not None and not self.is_bound:
                     try:
-                        self.initial[f] = val.strftime("%Y-%m-%dT%H:%M")
+                        self.initial[f] = val.strftime(_DATETIME_LOCAL_FORMAT)
                     except Exception:
                         pass
 
@@ -210,7 +228,7 @@ class DonorItemForm(forms.ModelForm):
             self.add_error(None, "Fixed price signups are created during phase 2 by managers.")
 
         # bidding types need opening minimum; increment will be automatic
-        if t in (Item.TYPE_GOOD, Item.TYPE_SERVICE, Item.TYPE_EVENT):
+        if t in _BIDDING_TYPES:
             if opening in (None, ""):
                 self.add_error("opening_min_bid", "Required for bidding items.")
 
@@ -241,7 +259,7 @@ class DonorItemForm(forms.ModelForm):
         # basic positivity checks
         for field in ("opening_min_bid", "buy_now_price"):
             val = cleaned.get(field)
-            if val is not None and val <= Decimal(0):
+            if val is not None and val <= _ZERO:
                 self.add_error(field, "Must be positive.")
         if qty is not None and qty < 1:
             self.add_error("quantity_total", "Must be at least 1.")
@@ -11,19 +11,20 @@ class Command(BaseCommand):
         donor_group, _ = Group.objects.get_or_create(name="Donor")
         manager_group, _ = Group.objects.get_or_create(name="Manager")
 
-        # Assign basic model permissions to Manager on Item
+        # Fetch all Item permissions used below in a single query
         ct = ContentType.objects.get_for_model(Item)
-        perms = Permission.objects.filter(content_type=ct, codename__in=[
-            "add_item", "change_item", "view_item",
-        ])
-        manager_group.permissions.set(perms)
-        manager_group.save()
+        pmap = {
+            p.codename: p
+            for p in Permission.objects.filter(content_type=ct, codename__in=[
+                "add_item", "change_item", "view_item",
+            ])
+        }
+
+        # Assign basic model permissions to Manager on Item
+        # (M2M .set() writes the through rows directly; no Group.save() needed)
+        manager_group.permissions.set([pmap["add_item"], pmap["change_item"], pmap["view_item"]])
 
         # Donor has add/view item; edits restricted in code to owner-only
-        donor_perms = Permission.objects.filter(content_type=ct, codename__in=[
-            "add_item", "view_item",
-        ])
-        donor_group.permissions.set(donor_perms)
-        donor_group.save()
+        donor_group.permissions.set([pmap["add_item"], pmap["view_item"]])
 
         self.stdout.write(self.style.SUCCESS("Groups ensured: Donor, Manager with permissions."))
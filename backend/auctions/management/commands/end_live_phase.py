@@ -1,7 +1,8 @@
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
-from django.db.models import OuterRef, Subquery
 
 from auctions.models import Auction, Item, Bid
 
@@ -51,33 +52,52 @@ class Command(BaseCommand):
 
         # Items eligible to close: published and not fixed-price
         qs = Item.objects.filter(auction=auction, status=Item.STATUS_PUBLISHED).exclude(type=Item.TYPE_FIXED_PRICE)
-
-        # Determine top bid per item
-        top_bidder_sq = Bid.objects.filter(item=OuterRef("pk")).order_by("-amount", "-created_at").values("bidder_id")[:1]
-        top_amount_sq = Bid.objects.filter(item=OuterRef("pk")).order_by("-amount", "-created_at").values("amount")[:1]
-
-        items = (
-            qs.select_related("category", "donor")
-            .annotate(top_bidder_id=Subquery(top_bidder_sq), top_amount=Subquery(top_amount_sq))
-            .order_by("title")
-        )
-
-        to_mark_sold = []
-        to_leave_published = []
-
-        for it in items:
-            if it.top_bidder_id is not None and it.top_amount is not None:
-                to_mark_sold.append(it)
-                if verbose_items:
-                    self.stdout.write(f"WIN: {it.title} -> SOLD at {it.top_amount}")
+        # Eligible items with at least one bid, kept as a subquery so the UPDATE
+        # below never round-trips the pk list through Python.
+        winning_item_ids = Bid.objects.filter(item__in=qs).values("item_id").distinct()
+
+        sold_count = 0
+        unsold_count = 0
+        if verbose_items:
+            # Determine top bid per item in one pass instead of correlated
+            # subqueries evaluated per item row: DISTINCT ON on Postgres, the
+            # first row of each item's window elsewhere.
+            bids = Bid.objects.filter(item__in=qs)
+            if connection.vendor == "postgresql":
+                bids = bids.order_by("item_id", "-amount", "-created_at").distinct("item_id")
             else:
-                to_leave_published.append(it)
-                if verbose_items:
+                bids = bids.annotate(
+                    rn=Window(
+                        RowNumber(),
+                        partition_by=F("item_id"),
+                        order_by=[F("amount").desc(), F("created_at").desc()],
+                    )
+                ).filter(rn=1)
+            top_bids = {
+                item_id: (bidder_id, amount)
+                for item_id, bidder_id, amount in bids.values_list("item_id", "bidder_id", "amount")
+            }
+
+            # The loop below reads only pk/title; skip the wide text/image columns.
+            items = qs.only("pk", "title").order_by("title")
+
+            # Stream rows rather than caching the whole result set; it is read once.
+            for it in items.iterator(chunk_size=500):
+                top = top_bids.get(it.pk)
+                if top is not None:
+                    sold_count += 1
+                    self.stdout.write(f"WIN: {it.title} -> SOLD at {top[1]}")
+                else:
+                    unsold_count += 1
                     self.stdout.write(f"NO BIDS: {it.title} (remains Published for potential reoffer)")
+        else:
+            # Without the per-item listing only the totals are needed
+            sold_count = winning_item_ids.count()
+            unsold_count = qs.count() - sold_count
 
         self.stdout.write(
             self.style.WARNING(
-                f"Summary: {len(to_mark_sold)} to mark SOLD, {len(to_leave_published)} remain PUBLISHED"
+                f"Summary: {sold_count} to mark SOLD, {unsold_count} remain PUBLISHED"
             )
         )
 
@@ -87,8 +107,7 @@ class Command(BaseCommand):
 
         with transaction.atomic():
             # Mark winners as SOLD
-            if to_mark_sold:
-                Item.objects.filter(pk__in=[i.pk for i in to_mark_sold]).update(status=Item.STATUS_SOLD)
+            qs.filter(pk__in=winning_item_ids).update(status=Item.STATUS_SOLD)
 
             # Optionally close auction
             if close_auction:
@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+
+from auctions.models import Item, Bid, Signup
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the denormalised Item counters (current_bid_amount and bid_count from bids, "
+        "quantity_sold from confirmed signups), walking items in pk order so large tables are "
+        "processed in bounded chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Items per chunk (default 2000)",
+        )
+        parser.add_argument(
+            "--start-pk",
+            type=int,
+            default=0,
+            help="Resume after this item pk (printed as progress by a previous run)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted items without saving",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options.get("chunk_size") or 2000
+        last_pk = options.get("start_pk") or 0
+        dry_run = options.get("dry_run", False)
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        checked = 0
+        fixed = 0
+        while True:
+            with transaction.atomic():
+                # Lock the chunk so a concurrent bid's trigger update queues behind
+                # this write instead of being overwritten by it.
+                batch = list(
+                    Item.objects.select_for_update()
+                    .filter(pk__gt=last_pk)
+                    .order_by("pk")
+                    .only("pk", "current_bid_amount", "bid_count", "quantity_sold")[:chunk_size]
+                )
+                if not batch:
+                    break
+                pks = [it.pk for it in batch]
+                stats = {
+                    row["item_id"]: (row["top"], row["n"])
+                    for row in Bid.objects.filter(item_id__in=pks)
+                    .values("item_id")
+                    .annotate(top=Max("amount"), n=Count("id"))
+                }
+                seats = dict(
+                    Signup.objects.filter(item_id__in=pks, waitlisted=False)
+                    .values("item_id")
+                    .annotate(s=Sum("quantity"))
+                    .values_list("item_id", "s")
+                )
+                stale = []
+                for it in batch:
+                    top, n = stats.get(it.pk, (None, 0))
+                    sold = seats.get(it.pk, 0)
+                    if it.current_bid_amount != top or it.bid_count != n or it.quantity_sold != sold:
+                        it.current_bid_amount = top
+                        it.bid_count = n
+                        it.quantity_sold = sold
+                        stale.append(it)
+                if stale and not dry_run:
+                    Item.objects.bulk_update(stale, ["current_bid_amount", "bid_count", "quantity_sold"])
+            checked += len(batch)
+            fixed += len(stale)
+            last_pk = batch[-1].pk
+            if options.get("verbosity", 1) > 1:
+                self.stdout.write(f"Checked through pk {last_pk} ({fixed} drifted so far)")
+
+        verb = "would be fixed" if dry_run else "fixed"
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} items; {fixed} {verb}."))
@@ -10,11 +10,11 @@ class Command(BaseCommand):
     help = "Create default auth groups (Manager, Donor). Safe to run multiple times."
 
     def handle(self, *args, **options):
-        created = []
-        for name, _desc in GROUPS:
-            g, was_created = Group.objects.get_or_create(name=name)
-            if was_created:
-                created.append(name)
+        names = [name for name, _desc in GROUPS]
+        existing = set(Group.objects.filter(name__in=names).values_list("name", flat=True))
+        created = [name for name in names if name not in existing]
+        # ignore_conflicts covers a concurrent run creating the same group
+        Group.objects.bulk_create([Group(name=name) for name in created], ignore_conflicts=True)
         if created:
             self.stdout.write(self.style.SUCCESS(f"Created groups: {', '.join(created)}"))
         else:
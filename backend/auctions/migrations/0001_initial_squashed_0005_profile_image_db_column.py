@@ -0,0 +1,126 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:09
+#
+# Squash of 0001-0005, hand-optimised: the later AddFields (Signup.quantity,
+# Item location fields, Profile.image) are folded into CreateModel. The
+# ADD COLUMN IF NOT EXISTS repair from 0004/0005 only mattered for databases
+# that ran the original migrations; a squashed migration only ever runs on a
+# fresh database, where CreateModel already creates the image column.
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    replaces = [('auctions', '0001_initial'), ('auctions', '0002_signup_quantity'), ('auctions', '0003_profile'), ('auctions', '0004_item_at_church_item_location_address_and_more'), ('auctions', '0005_profile_image_db_column')]
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Auction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveIntegerField(unique=True)),
+                ('slug', models.SlugField(unique=True)),
+                ('title', models.CharField(max_length=200)),
+                ('starts_at', models.DateTimeField(blank=True, null=True)),
+                ('ends_at', models.DateTimeField(blank=True, null=True)),
+                ('reoffer_starts_at', models.DateTimeField(blank=True, null=True)),
+                ('reoffer_ends_at', models.DateTimeField(blank=True, null=True)),
+                ('state', models.CharField(choices=[('draft', 'Draft'), ('open', 'Open for Bidding'), ('closed', 'Closed'), ('reoffer', 'Reoffer')], default='draft', max_length=20)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120, unique=True)),
+                ('slug', models.SlugField(unique=True)),
+                ('active', models.BooleanField(default=True)),
+                ('sort_order', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['sort_order', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Item',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('event', 'Hosted Event'), ('good', 'Good'), ('service', 'Service'), ('fixed', 'Fixed Price Signup')], max_length=16)),
+                ('slug', models.SlugField(unique=True)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('restrictions', models.TextField(blank=True)),
+                ('at_church', models.BooleanField(default=False)),
+                ('location_name', models.CharField(blank=True, max_length=200)),
+                ('location_address', models.TextField(blank=True)),
+                ('opening_min_bid', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('bid_increment', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('buy_now_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('quantity_total', models.PositiveIntegerField(default=1)),
+                ('quantity_sold', models.PositiveIntegerField(default=0)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('published', 'Published'), ('sold', 'Sold/Closed'), ('archived', 'Archived')], default='draft', max_length=16)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('auction', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='items', to='auctions.auction')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='items', to='auctions.category')),
+                ('donor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='donated_items', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['title'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Bid',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('idempotency_key', models.CharField(blank=True, max_length=64, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('bidder', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bids', to=settings.AUTH_USER_MODEL)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bids', to='auctions.item')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Signup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(default=1)),
+                ('waitlisted', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signups', to='auctions.item')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='signups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'unique_together': {('item', 'user')},
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='bid',
+            constraint=models.UniqueConstraint(condition=models.Q(('idempotency_key__isnull', False)), fields=('item', 'bidder', 'idempotency_key'), name='uniq_bid_idem_per_item_bidder'),
+        ),
+        migrations.CreateModel(
+            name='Profile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(blank=True, null=True, upload_to='avatars/')),
+                ('phone', models.CharField(blank=True, max_length=40)),
+                ('address_line1', models.CharField(blank=True, max_length=200, verbose_name='Address line 1')),
+                ('address_line2', models.CharField(blank=True, max_length=200, verbose_name='Address line 2')),
+                ('city', models.CharField(blank=True, max_length=100)),
+                ('state', models.CharField(blank=True, max_length=100)),
+                ('postal_code', models.CharField(blank=True, max_length=20)),
+                ('country', models.CharField(blank=True, max_length=100)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profile', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
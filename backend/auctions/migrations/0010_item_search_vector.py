@@ -0,0 +1,67 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:01
+#
+# The tsvector column is part of model state on every backend, but the trigger
+# that maintains it and its GIN index are Postgres-only, so they are created
+# from RunPython and skipped elsewhere (e.g. the SQLite CI database).
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+CREATE_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION auctions_item_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.restrictions, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER auctions_item_search_vector_trg
+        BEFORE INSERT OR UPDATE OF title, description, restrictions ON auctions_item
+        FOR EACH ROW EXECUTE FUNCTION auctions_item_search_vector_update()
+    """,
+    # Backfill existing rows through the trigger
+    "UPDATE auctions_item SET title = title",
+    "CREATE INDEX auctions_item_search_vector_gin ON auctions_item USING gin (search_vector)",
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS auctions_item_search_vector_gin",
+    "DROP TRIGGER IF EXISTS auctions_item_search_vector_trg ON auctions_item",
+    "DROP FUNCTION IF EXISTS auctions_item_search_vector_update()",
+]
+
+
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0009_proxybid_seats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
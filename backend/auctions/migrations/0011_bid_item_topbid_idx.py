@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0010_item_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['item', '-amount', '-created_at'], name='bid_item_topbid_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0011_bid_item_topbid_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['item', '-created_at'], name='bid_item_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['auction', 'status'], name='item_auction_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['status', 'title'], name='item_status_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(fields=['item', 'waitlisted', 'created_at'], name='signup_item_wl_created_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0013_image_dimensions'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Add the named constraint before dropping unique_together so the
+        # (item, user) uniqueness is never absent.
+        migrations.AddConstraint(
+            model_name='signup',
+            constraint=models.UniqueConstraint(fields=('item', 'user'), name='uniq_signup_item_user'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='signup',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='signup',
+            index=models.Index(condition=models.Q(('waitlisted', False)), fields=['item'], include=('quantity',), name='signup_active_item_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:10
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0014_signup_constraint_active_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='bid',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='item',
+            options={},
+        ),
+    ]
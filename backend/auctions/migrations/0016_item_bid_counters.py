@@ -0,0 +1,132 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:12
+#
+# Item.current_bid_amount / Item.bid_count are maintained by triggers on
+# auctions_bid. Inserts (the hot path) bump the counters in place; updates and
+# deletes recompute them for the affected item(s). Postgres and SQLite get
+# equivalent triggers; other backends would need the reconcile command.
+
+from django.db import migrations, models
+
+
+BACKFILL_SQL = """
+    UPDATE auctions_item SET
+        current_bid_amount = (SELECT MAX(b.amount) FROM auctions_bid b WHERE b.item_id = auctions_item.id),
+        bid_count = (SELECT COUNT(*) FROM auctions_bid b WHERE b.item_id = auctions_item.id)
+"""
+
+POSTGRES_CREATE_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION auctions_bid_item_counters() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE auctions_item
+               SET current_bid_amount = GREATEST(current_bid_amount, NEW.amount),
+                   bid_count = bid_count + 1
+             WHERE id = NEW.item_id;
+            RETURN NULL;
+        END IF;
+        UPDATE auctions_item i
+           SET current_bid_amount = (SELECT MAX(b.amount) FROM auctions_bid b WHERE b.item_id = i.id),
+               bid_count = (SELECT COUNT(*) FROM auctions_bid b WHERE b.item_id = i.id)
+         WHERE i.id = OLD.item_id OR (TG_OP = 'UPDATE' AND i.id = NEW.item_id);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER auctions_bid_item_counters_trg
+        AFTER INSERT OR DELETE OR UPDATE OF item_id, amount ON auctions_bid
+        FOR EACH ROW EXECUTE FUNCTION auctions_bid_item_counters()
+    """,
+]
+
+POSTGRES_DROP_SQL = [
+    "DROP TRIGGER IF EXISTS auctions_bid_item_counters_trg ON auctions_bid",
+    "DROP FUNCTION IF EXISTS auctions_bid_item_counters()",
+]
+
+SQLITE_RECOMPUTE = """
+        UPDATE auctions_item SET
+            current_bid_amount = (SELECT MAX(b.amount) FROM auctions_bid b WHERE b.item_id = auctions_item.id),
+            bid_count = (SELECT COUNT(*) FROM auctions_bid b WHERE b.item_id = auctions_item.id)
+"""
+
+SQLITE_CREATE_SQL = [
+    """
+    CREATE TRIGGER auctions_bid_item_counters_ins AFTER INSERT ON auctions_bid
+    BEGIN
+        UPDATE auctions_item SET
+            current_bid_amount = CASE
+                WHEN current_bid_amount IS NULL OR NEW.amount > current_bid_amount THEN NEW.amount
+                ELSE current_bid_amount END,
+            bid_count = bid_count + 1
+        WHERE id = NEW.item_id;
+    END
+    """,
+    """
+    CREATE TRIGGER auctions_bid_item_counters_del AFTER DELETE ON auctions_bid
+    BEGIN
+    """ + SQLITE_RECOMPUTE + """
+        WHERE id = OLD.item_id;
+    END
+    """,
+    """
+    CREATE TRIGGER auctions_bid_item_counters_upd AFTER UPDATE OF item_id, amount ON auctions_bid
+    BEGIN
+    """ + SQLITE_RECOMPUTE + """
+        WHERE id IN (OLD.item_id, NEW.item_id);
+    END
+    """,
+]
+
+SQLITE_DROP_SQL = [
+    "DROP TRIGGER IF EXISTS auctions_bid_item_counters_ins",
+    "DROP TRIGGER IF EXISTS auctions_bid_item_counters_del",
+    "DROP TRIGGER IF EXISTS auctions_bid_item_counters_upd",
+]
+
+
+def create_counter_triggers(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        statements = POSTGRES_CREATE_SQL
+    elif vendor == "sqlite":
+        statements = SQLITE_CREATE_SQL
+    else:
+        statements = []
+    for sql in statements:
+        schema_editor.execute(sql)
+    schema_editor.execute(BACKFILL_SQL)
+
+
+def drop_counter_triggers(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        statements = POSTGRES_DROP_SQL
+    elif vendor == "sqlite":
+        statements = SQLITE_DROP_SQL
+    else:
+        statements = []
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0015_drop_item_bid_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='bid_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='current_bid_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.RunPython(create_counter_triggers, drop_counter_triggers),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0016_item_bid_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['category', 'status', 'title', 'id'], name='item_cat_status_title_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-15 22:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0017_item_cat_status_title_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proxybid',
+            index=models.Index(fields=['item', '-max_amount', 'updated_at'], name='proxybid_item_rank_idx'),
+        ),
+    ]
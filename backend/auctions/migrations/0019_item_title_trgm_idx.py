@@ -0,0 +1,38 @@
+# Trigram index for substring search on item titles. pg_trgm and GIN are
+# Postgres-only, so they are created from RunPython and skipped elsewhere
+# (e.g. the SQLite CI database). The index is on UPPER(title) to match the
+# expression Django emits for title__icontains. Servers without the contrib
+# extensions just keep the sequential match.
+
+from django.db import migrations
+
+
+def create_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS auctions_item_utitle_trgm "
+        "ON auctions_item USING gin (UPPER(title) gin_trgm_ops)"
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS auctions_item_utitle_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auctions', '0018_proxybid_item_rank_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
@@ -1,6 +1,34 @@
 from django.db import models
 from django.conf import settings
 from django.db.models import Q
+from django.contrib.postgres.search import SearchVectorField
+from django.core.cache import cache
+from django.core.files.images import get_image_dimensions
+
+
+def _sync_image_dimensions(instance, update_fields=None):
+    """Record image_width/height when a new image is assigned (or cleared).
+
+    Dimensions are read from the upload once at save time, so templates can
+    size <img> tags without opening the file from storage on each render.
+    Returns update_fields extended with the dimension columns when needed.
+    """
+    if "image" in instance.get_deferred_fields():
+        # Not loaded, so it cannot have been reassigned; don't fetch it
+        return update_fields
+    image = instance.image
+    if image and not getattr(image, "_committed", True):
+        try:
+            instance.image_width, instance.image_height = get_image_dimensions(image)
+        except Exception:
+            instance.image_width = instance.image_height = None
+    elif not image:
+        instance.image_width = instance.image_height = None
+    else:
+        return update_fields
+    if update_fields is not None and "image" in update_fields:
+        update_fields = {*update_fields, "image_width", "image_height"}
+    return update_fields
 
 
 class Auction(models.Model):
@@ -24,9 +52,33 @@ class Auction(models.Model):
     reoffer_ends_at = models.DateTimeField(null=True, blank=True)
     state = models.CharField(max_length=20, choices=STATE_CHOICES, default=DRAFT)
 
+    # Shared cache key for current_id(); the timeout bounds staleness after
+    # queryset-level writes, which bypass save()/delete().
+    CURRENT_ID_CACHE_KEY = "auctions:current_auction_id"
+    CURRENT_ID_CACHE_TIMEOUT = 60 * 60
+
     def __str__(self) -> str:
         return f"Auction {self.year}"
 
+    @classmethod
+    def current_id(cls):
+        """pk of the latest auction (highest year), or None if there is none."""
+        pk = cache.get(cls.CURRENT_ID_CACHE_KEY)
+        if pk is None:
+            pk = cls.objects.order_by("-year").values_list("pk", flat=True).first()
+            if pk is not None:
+                cache.set(cls.CURRENT_ID_CACHE_KEY, pk, cls.CURRENT_ID_CACHE_TIMEOUT)
+        return pk
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        cache.delete(self.CURRENT_ID_CACHE_KEY)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        cache.delete(self.CURRENT_ID_CACHE_KEY)
+        return result
+
 
 class Category(models.Model):
     name = models.CharField(max_length=120, unique=True)
@@ -78,6 +130,8 @@ class Item(models.Model):
     location_name = models.CharField(max_length=200, blank=True)
     location_address = models.TextField(blank=True)
     image = models.ImageField(upload_to="items/", null=True, blank=True)
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
 
     # Hosted event scheduling (optional for donors; managers can finalize later)
     event_starts_at = models.DateTimeField(null=True, blank=True)
@@ -86,6 +140,10 @@ class Item(models.Model):
     opening_min_bid = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     bid_increment = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     buy_now_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    # Highest bid amount and number of bids, maintained by database triggers on
+    # auctions_bid (see migration 0016) so pages don't aggregate over bids.
+    current_bid_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, editable=False)
+    bid_count = models.PositiveIntegerField(default=0, editable=False)
 
     quantity_total = models.PositiveIntegerField(default=1)
     quantity_sold = models.PositiveIntegerField(default=0)
@@ -94,12 +152,46 @@ class Item(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search document over title/description/restrictions. On Postgres
+    # it is maintained by a trigger and GIN-indexed (see migration 0010).
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Text search configuration used by the trigger and by SearchQuery lookups
+    SEARCH_CONFIG = "english"
+
+    # Owned by the auctions_bid triggers; ordinary saves must not write back a
+    # copy that may be stale by the time the row is saved.
+    TRIGGER_MAINTAINED_FIELDS = frozenset({"current_bid_amount", "bid_count"})
+
     class Meta:
-        ordering = ["title"]
+        # No default ordering: list views order explicitly, and other queries
+        # (counts, subqueries, lookups by slug) shouldn't pay for a sort.
+        indexes = [
+            # Catalog/manager listings filter by auction + status and sort by title
+            models.Index(fields=["auction", "status"], name="item_auction_status_idx"),
+            models.Index(fields=["status", "title"], name="item_status_title_idx"),
+            # Catalog pages per category: category IN (...)/= + status, ordered by (title, pk)
+            models.Index(fields=["category", "status", "title", "id"], name="item_cat_status_title_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
+    @property
+    def spots_left(self) -> int:
+        """Fixed-price seats not yet confirmed, from the quantity_sold counter."""
+        return max(0, (self.quantity_total or 0) - (self.quantity_sold or 0))
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None and not self._state.adding and not kwargs.get("force_insert"):
+            skip = self.TRIGGER_MAINTAINED_FIELDS | self.get_deferred_fields()
+            update_fields = [
+                f.name for f in self._meta.concrete_fields if not f.primary_key and f.attname not in skip
+            ]
+        kwargs["update_fields"] = _sync_image_dimensions(self, update_fields)
+        super().save(*args, **kwargs)
+
 
 class Bid(models.Model):
     item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name='bids')
@@ -109,7 +201,6 @@ class Bid(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['-created_at']
         constraints = [
             models.UniqueConstraint(
                 fields=['item', 'bidder', 'idempotency_key'],
@@ -117,6 +208,12 @@ class Bid(models.Model):
                 condition=Q(idempotency_key__isnull=False),
             )
         ]
+        indexes = [
+            # Serves "top bid per item" (ORDER BY amount DESC, created_at DESC)
+            models.Index(fields=['item', '-amount', '-created_at'], name='bid_item_topbid_idx'),
+            # Per-item bid history, newest first
+            models.Index(fields=['item', '-created_at'], name='bid_item_created_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"Bid {self.amount} on {self.item_id} by {self.bidder_id}"
@@ -139,6 +236,10 @@ class ProxyBid(models.Model):
     class Meta:
         unique_together = (("item", "bidder"),)
         ordering = ['-max_amount', 'updated_at']
+        indexes = [
+            # Per-item proxies in ranking order (the Meta ordering), for pricing
+            models.Index(fields=['item', '-max_amount', 'updated_at'], name='proxybid_item_rank_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"ProxyBid max={self.max_amount} item={self.item_id} bidder={self.bidder_id}"
@@ -153,7 +254,21 @@ class Signup(models.Model):
 
     class Meta:
         ordering = ['created_at']
-        unique_together = (("item", "user"),)
+        constraints = [
+            models.UniqueConstraint(fields=['item', 'user'], name='uniq_signup_item_user'),
+        ]
+        indexes = [
+            # Confirmed/waitlist sums and FIFO waitlist promotion per item
+            models.Index(fields=['item', 'waitlisted', 'created_at'], name='signup_item_wl_created_idx'),
+            # Capacity checks sum confirmed quantity only; on Postgres the
+            # INCLUDE makes that an index-only scan (ignored elsewhere).
+            models.Index(
+                fields=['item'],
+                include=['quantity'],
+                condition=Q(waitlisted=False),
+                name='signup_active_item_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Signup u={self.user_id} item={self.item_id} wl={self.waitlisted} quantity={self.quantity}"
@@ -162,6 +277,8 @@ class Signup(models.Model):
 class Profile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile")
     image = models.ImageField(upload_to="avatars/", null=True, blank=True)
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
     phone = models.CharField(max_length=40, blank=True)
     address_line1 = models.CharField("Address line 1", max_length=200, blank=True)
     address_line2 = models.CharField("Address line 2", max_length=200, blank=True)
@@ -172,3 +289,7 @@ class Profile(models.Model):
 
     def __str__(self) -> str:
         return f"Profile of {self.user_id}"
+
+    def save(self, *args, **kwargs):
+        kwargs["update_fields"] = _sync_image_dimensions(self, kwargs.get("update_fields"))
+        super().save(*args, **kwargs)
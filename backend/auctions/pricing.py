@@ -0,0 +1,64 @@
+"""Uniform-price proxy auction outcome, independent of models and queries."""
+
+import heapq
+from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
+from typing import Callable, Iterable, Optional
+
+
+def uniform_price_outcome(
+    rows: Iterable[tuple[Decimal, datetime, int, int]],
+    opening: Decimal,
+    K: int,
+    increment_fn: Callable[[Decimal], Decimal],
+) -> tuple[Optional[int], Decimal, bool, dict[int, int]]:
+    """Price K seats from proxy rows.
+
+    ``rows`` are (max_amount, updated_at, bidder_id, seats) tuples in any
+    order, at most one per bidder (ProxyBid is unique per item and bidder).
+    Each proxy asks for ``seats`` units (at least one) at its maximum; ranked
+    by (max_amount desc, updated_at asc), the first K units win.
+    Returns (top_bidder_id, public_price, is_full, winners_map):
+    - at most K units: price is ``opening`` and the item is not full;
+    - otherwise price = min(Kth unit max, (K+1)th unit max + its increment),
+      never below ``opening``.
+    winners_map is {bidder_id: seats won}.
+    """
+    ranked = [(amt, updated_at, bidder_id, max(1, int(seats or 1))) for amt, updated_at, bidder_id, seats in rows]
+    if not ranked:
+        return None, opening, False, {}
+    if len(ranked) > 4 * K:
+        # Every proxy holds at least one seat, so the walk below never reaches
+        # past the first K+1; select those in O(P log K) rather than sorting
+        # all P. Earlier updated_at ranks higher via a larger (ref - updated_at).
+        ref = ranked[0][1]
+        ranked = heapq.nlargest(K + 1, ranked, key=lambda p: (p[0], ref - p[1]))
+    else:
+        # Two stable passes instead of a (-amount, updated_at) tuple key: no
+        # Decimal negation or key tuple per row, and amounts stay exact.
+        ranked.sort(key=itemgetter(1))
+        ranked.sort(key=itemgetter(0), reverse=True)
+    # Walk whole proxies (not one entry per seat) until K seats are taken; the
+    # unit after them is either a leftover seat of the marginal proxy or the
+    # next proxy's first seat.
+    winners_map = {}
+    taken = 0
+    kth_max = next_max = None
+    for amt, _, bidder_id, seats in ranked:
+        if taken == K:
+            next_max = amt
+            break
+        won = min(seats, K - taken)
+        winners_map[bidder_id] = won
+        taken += won
+        if taken == K:
+            kth_max = amt
+            if won < seats:
+                next_max = amt
+                break
+    top_bidder = ranked[0][2]
+    if next_max is None:
+        return top_bidder, opening, False, winners_map
+    price = max(min(kth_max, next_max + increment_fn(next_max)), opening)
+    return top_bidder, price, True, winners_map
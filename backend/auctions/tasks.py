@@ -0,0 +1,40 @@
+from functools import lru_cache
+
+from celery import shared_task
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def _telnyx():
+    """Configure the Telnyx SDK once per process.
+
+    A shared RequestsClient keeps its HTTP session (and the TLS connection to
+    Telnyx) alive across sends; by default the SDK builds a new client per call.
+    Its timeout is TELNYX_TIMEOUT so a stalled API call cannot hold a worker
+    (or, without Celery, the admin request) for the SDK's 80 seconds.
+    """
+    import telnyx
+    from telnyx.http_client import RequestsClient
+
+    telnyx.api_key = settings.TELNYX_API_KEY
+    telnyx.default_http_client = RequestsClient(timeout=settings.TELNYX_TIMEOUT)
+    return telnyx
+
+
+def send_sms(to, text):
+    """Send an SMS through Telnyx and return the message id (or None).
+
+    Credentials come from the settings of whichever process runs this, so the
+    API key never travels through the task broker.
+    """
+    telnyx = _telnyx()
+    if settings.TELNYX_MESSAGING_PROFILE_ID:
+        msg = telnyx.Message.create(to=to, messaging_profile_id=settings.TELNYX_MESSAGING_PROFILE_ID, text=text)
+    else:
+        msg = telnyx.Message.create(to=to, from_=settings.TELNYX_FROM_NUMBER, text=text)
+    return getattr(msg, "id", None)
+
+
+@shared_task
+def send_test_sms(to, text):
+    return send_sms(to, text)
@@ -1,7 +1,12 @@
 from django import template
 from auctions.utils import is_manager as _is_manager
+from functools import lru_cache
 import hashlib
 
+# Template tag libraries are imported by every process that loads templates
+# (including management commands), so keep module-level imports to the stdlib
+# and Django; import anything heavier (PIL, storage SDKs) inside the tag.
+
 register = template.Library()
 
 
@@ -13,6 +18,15 @@ def is_manager(user):
         return False
 
 
+@lru_cache(maxsize=4096)
+def _gravatar_url(email: str, size: int) -> str:
+    if not email:
+        # default anonymous avatar
+        return f"https://www.gravatar.com/avatar/?s={size}&d=mp"
+    h = hashlib.sha256(email.encode("utf-8")).hexdigest()
+    return f"https://www.gravatar.com/avatar/{h}?s={size}&d=mp"
+
+
 @register.simple_tag
 def avatar_url(user, size=32):
     """Return a Gravatar URL for the user email. Non-invasive; no DB changes required.
@@ -20,22 +34,19 @@ def avatar_url(user, size=32):
     """
     try:
         email = (getattr(user, "email", "") or "").strip().lower()
-        if not email:
-            # default anonymous avatar
-            return f"https://www.gravatar.com/avatar/?s={int(size)}&d=mp"
-        h = hashlib.md5(email.encode("utf-8")).hexdigest()
-        return f"https://www.gravatar.com/avatar/{h}?s={int(size)}&d=mp"
+        return _gravatar_url(email, int(size))
     except Exception:
         return f"https://www.gravatar.com/avatar/?s={int(size)}&d=mp"
 
 
 @register.filter(name="initials")
 def initials(user):
-    first = (getattr(user, "first_name", "") or "").strip()
-    last = (getattr(user, "last_name", "") or "").strip()
+    # Form fields strip whitespace on input, so stored names need no .strip()
+    first = getattr(user, "first_name", None) or ""
+    last = getattr(user, "last_name", None) or ""
     if first or last:
         return (first[:1] + last[:1]).upper()
-    email = (getattr(user, "email", "") or "").strip()
+    email = getattr(user, "email", None) or ""
     return (email[:1] or "?").upper()
 
 
@@ -44,11 +55,24 @@ def user_avatar_url(user, size=48):
     """Prefer the uploaded profile image if present; otherwise use Gravatar.
     Safe to call even if Profile does not exist.
     """
+    # Memoised on the user instance so repeated tags for request.user resolve
+    # the profile and storage URL once per request.
+    cache = getattr(user, "_avatar_url_cache", None)
+    if cache is None:
+        cache = {}
+        try:
+            user._avatar_url_cache = cache
+        except Exception:
+            pass
+    if size in cache:
+        return cache[size]
+    url = None
     try:
         prof = getattr(user, "profile", None)
         if prof and getattr(prof, "image", None) and getattr(prof.image, "url", None):
-            return prof.image.url
+            url = prof.image.url
     except Exception:
         pass
     # fallback to gravatar
-    return avatar_url(user, size)
+    cache[size] = url or avatar_url(user, size)
+    return cache[size]
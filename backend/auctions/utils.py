@@ -1,31 +1,63 @@
 from django.utils.text import slugify
-from django.contrib.auth.models import Group
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect
 from django.contrib import messages
+from django.db import IntegrityError, transaction
+from bisect import bisect_right
 from functools import wraps
+import re
 from decimal import Decimal
 
 
 def unique_slug(model, base: str, slug_field: str = "slug") -> str:
     base_slug = slugify(base)[:50] or "item"
+    # One query for the base slug and all of its "-N" variants, then pick the
+    # first free suffix locally instead of probing candidates one at a time.
+    taken = set(
+        model.objects.filter(
+            **{f"{slug_field}__regex": rf"^{re.escape(base_slug)}(-[0-9]+)?$"}
+        ).values_list(slug_field, flat=True)
+    )
     slug = base_slug
     i = 2
-    while model.objects.filter(**{slug_field: slug}).exists():
+    while slug in taken:
         slug = f"{base_slug}-{i}"
         i += 1
     return slug
 
 
+def save_with_unique_slug(instance, base: str, slug_field: str = "slug") -> None:
+    """Insert a new instance under slugify(base), adding a suffix only on collision.
+
+    The unique index does the checking, so the usual collision-free create is
+    just the INSERT. On an IntegrityError the savepoint is rolled back and the
+    save retried once with the first free suffix from unique_slug(); any other
+    integrity failure surfaces from that retry.
+    """
+    setattr(instance, slug_field, slugify(base)[:50] or "item")
+    try:
+        with transaction.atomic():
+            instance.save()
+        return
+    except IntegrityError:
+        pass
+    setattr(instance, slug_field, unique_slug(type(instance), base, slug_field))
+    instance.save()
+
+
 def is_manager(user) -> bool:
     if not user.is_authenticated:
         return False
     if user.is_staff or user.is_superuser:
         return True
-    try:
-        return user.groups.filter(name="Manager").exists()
-    except Group.DoesNotExist:
-        return False
+    # request.user is rebuilt per request, so caching on the instance lets the
+    # decorator, views and template filter share a single group query.
+    cached = getattr(user, "_is_manager_cache", None)
+    if cached is not None:
+        return cached
+    result = user.groups.filter(name="Manager").exists()
+    user._is_manager_cache = result
+    return result
 
 
 def manager_required(view_func):
@@ -46,6 +78,12 @@ def manager_required(view_func):
     return _wrapped
 
 
+# Tier lower bounds and the increment for each tier (one more increment than
+# bounds); built once so standard_increment only does a bisect.
+_INCREMENT_BOUNDS = (Decimal("25"), Decimal("100"), Decimal("250"), Decimal("500"), Decimal("1000"))
+_INCREMENTS = (Decimal("1"), Decimal("5"), Decimal("10"), Decimal("25"), Decimal("50"), Decimal("100"))
+
+
 def standard_increment(current: Decimal) -> Decimal:
     """Return the standard bid increment based on the current value.
 
@@ -58,17 +96,7 @@ def standard_increment(current: Decimal) -> Decimal:
       - >= 1000    -> 100
     """
     if current is None:
-        current = Decimal("0")
-    # Ensure Decimal
-    current = Decimal(current)
-    if current < Decimal("25"):
-        return Decimal("1")
-    if current < Decimal("100"):
-        return Decimal("5")
-    if current < Decimal("250"):
-        return Decimal("10")
-    if current < Decimal("500"):
-        return Decimal("25")
-    if current < Decimal("1000"):
-        return Decimal("50")
-    return Decimal("100")
+        return _INCREMENTS[0]
+    if not isinstance(current, Decimal):
+        current = Decimal(current)
+    return _INCREMENTS[bisect_right(_INCREMENT_BOUNDS, current)]
@@ -1,55 +1,143 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404, render
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.db.models import Prefetch, Sum, Q, OuterRef, Subquery
+from django.db.models import F, Prefetch, Q, OuterRef, Subquery, Sum, Window
+from django.db.models.functions import Coalesce, Greatest, Left
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect
-from django.db import transaction, IntegrityError
+from django.db import connection, transaction, IntegrityError
+from collections import defaultdict
+from copy import copy
 from decimal import Decimal
-from .models import Item, Category, Auction, Signup, Profile
+from functools import lru_cache, partial
+from .models import Item, Category, Auction, Signup, Profile, ProxyBid, Bid
 from django.contrib.auth.models import Group
+from django.contrib.postgres.search import SearchQuery
+from .pricing import uniform_price_outcome
 from .forms import RegisterForm, EmailLoginForm, DonorItemForm, ProfileForm, ManagerItemApprovalForm
-from .utils import unique_slug, is_manager, standard_increment, manager_required
+from .utils import save_with_unique_slug, is_manager, standard_increment, manager_required
+from .tasks import send_sms
+
+
+# Opening minimum when an item has none set. Model Decimal fields already come
+# back as Decimal, so the pricing code uses them (and this) without re-wrapping.
+_DEFAULT_OPENING_BID = Decimal("1.00")
+# Proxy maxima are stored to the cent; amounts are rounded to match before they
+# are written so in-memory rows equal what the database holds.
+_CENT = Decimal("0.01")
+
+# Cards per category on the grouped catalog, and per page when browsing one
+CATALOG_PAGE_SIZE = 24
+
+
+def _parse_catalog_cursor(raw):
+    """Split an ``after=<title>,<pk>`` keyset cursor; None if it is malformed."""
+    title, sep, pk = (raw or "").rpartition(",")
+    if not sep or not pk.isdigit():
+        return None
+    return title, int(pk)
+
+
+def _catalog_search(q):
+    """Catalog search filter for ``q``.
+
+    On Postgres the item text is matched through the GIN-indexed search_vector
+    (see migration 0010) rather than LIKE scans over three text columns, with
+    partial words in titles ("lam" for "Lamp") caught by the trigram index
+    from migration 0019. Matching category names are resolved to ids so every
+    arm can use an index. Other backends keep the substring match.
+    """
+    if connection.vendor == "postgresql":
+        return (
+            Q(search_vector=SearchQuery(q, config=Item.SEARCH_CONFIG, search_type="websearch"))
+            | Q(title__icontains=q)
+            | Q(category_id__in=Category.objects.filter(name__icontains=q).values("pk"))
+        )
+    return (
+        Q(title__icontains=q)
+        | Q(description__icontains=q)
+        | Q(restrictions__icontains=q)
+        | Q(category__name__icontains=q)
+    )
 
 
 def catalog_list(request):
     q = (request.GET.get("q") or "").strip()
     categories = Category.objects.filter(active=True).order_by("sort_order", "name")
+    # Only the columns the catalog cards render (plus category_id for grouping)
     items = (
-        Item.objects.select_related("auction", "category")
-        .filter(status=Item.STATUS_PUBLISHED)
-        .order_by("title")
+        Item.objects.filter(status=Item.STATUS_PUBLISHED)
+        .only(
+            "pk", "category_id", "slug", "title",
+            "image", "image_width", "image_height", "buy_now_price",
+        )
+        .order_by("title", "pk")
     )
     if q:
-        items = items.filter(
-            Q(title__icontains=q)
-            | Q(description__icontains=q)
-            | Q(restrictions__icontains=q)
-            | Q(category__name__icontains=q)
-        )
-        categories = categories.filter(items__in=items).distinct()
-    # Prefetch items per category for simple grouped display
-    categories = categories.prefetch_related(
-        Prefetch(
-            "items",
-            queryset=items,
-            to_attr="published_items",
+        items = items.filter(_catalog_search(q))
+    # Cards show at most 140 characters of the description; fetch just that
+    # prefix rather than the whole text column.
+    cards = items.annotate(description_excerpt=Left("description", 141))
+
+    category_slug = (request.GET.get("category") or "").strip()
+    if category_slug:
+        # One category, paged by (title, pk) keyset so deep pages cost the same
+        # as the first one.
+        category = get_object_or_404(categories, slug=category_slug)
+        page = cards.filter(category=category)
+        cursor = _parse_catalog_cursor(request.GET.get("after"))
+        if cursor:
+            title, pk = cursor
+            page = page.filter(Q(title__gt=title) | Q(title=title, pk__gt=pk))
+        category.published_items = list(page[: CATALOG_PAGE_SIZE + 1])
+        categories = [category]
+    else:
+        # Grouped display: only the first page of each category (one extra row
+        # tells the template whether to link to the rest).
+        categories = list(
+            categories.prefetch_related(
+                Prefetch("items", queryset=cards[: CATALOG_PAGE_SIZE + 1], to_attr="published_items")
+            )
         )
-    )
-    ctx = {"categories": categories, "q": q}
     if q:
-        try:
-            ctx["results_count"] = items.count()
-        except Exception:
-            ctx["results_count"] = None
+        # Only categories with matches; decided from the loaded cards rather
+        # than re-running the search as a category subquery.
+        categories = [c for c in categories if c.published_items]
+    for cat in categories:
+        cat.has_more = len(cat.published_items) > CATALOG_PAGE_SIZE
+        del cat.published_items[CATALOG_PAGE_SIZE:]
+        if cat.has_more:
+            last = cat.published_items[-1]
+            cat.next_after = f"{last.title},{last.pk}"
+
+    ctx = {"categories": categories, "q": q, "category_slug": category_slug}
+    if q:
+        if not (category_slug and request.GET.get("after")) and not any(c.has_more for c in categories):
+            # Every matching card is already on the page; no COUNT query
+            ctx["results_count"] = sum(len(c.published_items) for c in categories)
+        else:
+            try:
+                ctx["results_count"] = items.filter(category__in=[c.pk for c in categories]).count()
+            except Exception:
+                ctx["results_count"] = None
     return render(request, "auctions/catalog_list.html", ctx)
 
 
 def item_detail(request, slug):
+    # Seats requested across all proxies ride along with the item row; the top
+    # bid is already on it (current_bid_amount).
+    requested_seats = (
+        ProxyBid.objects.filter(item=OuterRef("pk"))
+        .order_by()
+        .values("item")
+        .annotate(total=Sum(Greatest(Coalesce("seats", 1), 1)))
+        .values("total")
+    )
     item = get_object_or_404(
-        Item.objects.select_related("auction", "category"), slug=slug
+        Item.objects.select_related("category").annotate(requested_seats=Subquery(requested_seats)), slug=slug
     )
     # compute context flags
     manager_can_publish = is_manager(request.user) and item.status == Item.STATUS_DRAFT
@@ -65,43 +153,23 @@ def item_detail(request, slug):
         except Exception:
             # Likely migrations missing for Signup in this environment
             user_signup = None
-    top_bid = None
     bid_seats_total = None
     bid_seats_available = None
     if can_bid:
-        try:
-            top_bid = item.bids.order_by("-amount", "-created_at").first()
-        except Exception:
-            top_bid = None
         # Show available seats without a bid yet (proxies placed)
         try:
-            from .models import ProxyBid  # local import
             bid_seats_total = max(1, int(item.quantity_total or 1))
-            # Sum of requested seats across all proxies
-            proxies = ProxyBid.objects.filter(item=item).values("seats")
-            requested = 0
-            for row in proxies:
-                requested += max(1, int(row.get("seats") or 1))
-            bid_seats_available = max(0, bid_seats_total - requested)
+            bid_seats_available = max(0, bid_seats_total - (item.requested_seats or 0))
         except Exception:
             bid_seats_total = None
             bid_seats_available = None
-    # compute spots left for fixed-price items
-    spots_left = 0
-    try:
-        qty_total = item.quantity_total or 0
-        qty_sold = item.quantity_sold or 0
-        spots_left = max(0, qty_total - qty_sold)
-    except Exception:
-        spots_left = 0
     ctx = {
         "item": item,
         "manager_can_publish": manager_can_publish,
         "can_bid": can_bid,
         "can_signup": can_signup,
         "user_signup": user_signup,
-        "top_bid": top_bid,
-        "spots_left": spots_left,
+        "spots_left": item.spots_left,
         "bid_seats_total": bid_seats_total,
         "bid_seats_available": bid_seats_available,
     }
@@ -112,7 +180,7 @@ def item_detail(request, slug):
 def place_bid(request, slug):
     if request.method != "POST":
         return redirect("auctions:item_detail", slug=slug)
-    item = get_object_or_404(Item.objects.select_related("auction"), slug=slug)
+    item = get_object_or_404(Item, slug=slug)
     if item.status != Item.STATUS_PUBLISHED or item.type == Item.TYPE_FIXED_PRICE:
         messages.error(request, "Bidding is not allowed on this item.")
         return redirect("auctions:item_detail", slug=item.slug)
@@ -131,105 +199,62 @@ def place_bid(request, slug):
     K_total = max(1, int(item.quantity_total or 1))
     req_seats = max(1, min(req_seats, K_total))
 
-    # Helpers for proxy bidding
-    def get_increment(base: Decimal) -> Decimal:
-        return item.bid_increment if item.bid_increment is not None else standard_increment(base)
-
-    def compute_current_state(locked_item):
-        """Compute uniform-price outcome for multi-quantity items with seat-demand.
-
-        Returns (top_bidder, public_price, is_full, winners_map)
-        - Expand each proxy bid into `seats` unit-demand slots with same (max_amount, updated_at, bidder_id)
-        - Sort units by (-max_amount, updated_at asc).
-        - K = item.quantity_total (>=1)
-        - If #units <= K: price = opening, is_full=False, winners are all units.
-        - Else: price = min(Kth unit max, (K+1)th unit max + increment((K+1)th)), at least opening.
-        - winners_map is {bidder_id: seats_allocated} among top K units.
-        """
-        from .models import ProxyBid  # local import
-        proxies = list(
-            ProxyBid.objects.filter(item=locked_item).select_for_update().order_by("-max_amount", "updated_at")
-        )
-        opening = Decimal(locked_item.opening_min_bid or Decimal("1.00"))
-        K = int(locked_item.quantity_total or 1)
-        K = max(1, K)
-        units = []  # list of tuples (max_amount:Decimal, updated_at, bidder_id)
-        for p in proxies:
-            seats = max(1, int(getattr(p, "seats", 1) or 1))
-            amt = Decimal(p.max_amount)
-            for _ in range(seats):
-                units.append((amt, p.updated_at, p.bidder_id))
-        if not units:
-            return None, opening, False, {}
-        # Sort by amount desc, time asc
-        units.sort(key=lambda t: (t[0] * -1, t[1]))
-        if len(units) <= K:
-            winners_map = {}
-            for _, __, bidder_id in units[:]:
-                winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-            # top bidder is the bidder_id of the highest unit
-            top_bidder = units[0][2]
-            return top_bidder, opening, False, winners_map
-        # More than K units
-        kth_max = Decimal(units[K - 1][0])
-        next_max = Decimal(units[K][0])
-        inc = Decimal(get_increment(next_max))
-        price = min(kth_max, next_max + inc)
-        price = max(price, opening)
-        winners_map = {}
-        for i in range(K):
-            _, __, bidder_id = units[i]
-            winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-        # leader = bidder with the top unit
-        top_bidder = units[0][2]
-        return top_bidder, price, True, winners_map
-
     try:
         with transaction.atomic():
             locked_item = Item.objects.select_for_update().get(pk=item.pk)
 
-            from .models import ProxyBid, Bid  # local import to avoid circulars
-
             # Current state before change
-            prev_top = locked_item.bids.order_by("-amount", "-created_at").first()
-            prev_leader, prev_price, prev_full, prev_winners = compute_current_state(locked_item)
+            # Top bid amount from the locked row (trigger-maintained), no bids query
+            prev_top_amount = locked_item.current_bid_amount
+            # Load the item's proxies once; the state after the upsert is
+            # recomputed from the same in-memory rows. Proxy writes (these
+            # views and the ProxyBid admin) all take the Item lock held here,
+            # so the rows need no FOR UPDATE (which would write a lock mark
+            # into each of them).
+            proxies = list(ProxyBid.objects.filter(item=locked_item))
+            prev_leader, prev_price, prev_full, prev_winners = _proxy_state(locked_item, _proxy_rows(proxies))
 
             # Upsert user's proxy bid
-            pb, created = ProxyBid.objects.select_for_update().get_or_create(
-                item=locked_item, bidder=request.user, defaults={"max_amount": max_amount, "seats": req_seats}
-            )
-            changed = False
-            if not created and max_amount > pb.max_amount:
-                pb.max_amount = max_amount
-                changed = True
-            # update requested seats if changed
-            if getattr(pb, "seats", 1) != req_seats:
-                pb.seats = req_seats
-                changed = True
-            if changed:
-                pb.save(update_fields=["max_amount", "seats", "updated_at"]) if hasattr(pb, "seats") else pb.save(update_fields=["max_amount", "updated_at"])
+            pb = next((p for p in proxies if p.bidder_id == request.user.id), None)
+            created = pb is None
+            if created:
+                pb = ProxyBid.objects.create(
+                    item=locked_item, bidder=request.user, max_amount=max_amount.quantize(_CENT), seats=req_seats
+                )
+                proxies.append(pb)
+            else:
+                changed = False
+                if max_amount > pb.max_amount:
+                    pb.max_amount = max_amount.quantize(_CENT)
+                    changed = True
+                # update requested seats if changed
+                if pb.seats != req_seats:
+                    pb.seats = req_seats
+                    changed = True
+                if changed:
+                    pb.save(update_fields=["max_amount", "seats", "updated_at"])
 
             # Recompute after change
-            new_leader, new_price, new_full, new_winners = compute_current_state(locked_item)
+            new_leader, new_price, new_full, new_winners = _proxy_state(locked_item, _proxy_rows(proxies))
 
             # Validation:
             # - If not full before, require at least opening minimum
             # - If full before and user is not among new winners, guidance: need at least prev_price + increment(prev_price)
             if not prev_full:
-                opening_req = Decimal(locked_item.opening_min_bid or Decimal("1.00"))
+                opening_req = locked_item.opening_min_bid or _DEFAULT_OPENING_BID
                 if max_amount < opening_req:
                     messages.error(request, f"Your maximum must be at least {opening_req}.")
                     return redirect("auctions:item_detail", slug=locked_item.slug)
             else:
                 if request.user.id not in new_winners:
-                    min_next = prev_price + Decimal(get_increment(prev_price))
+                    min_next = prev_price + _bid_increment(item, prev_price)
                     if max_amount < min_next and (not created and max_amount <= pb.max_amount):
                         messages.error(request, f"Your maximum must be at least {min_next} to secure a spot.")
                         return redirect("auctions:item_detail", slug=locked_item.slug)
 
             # If the public price/leader changed, record a Bid row for audit/visibility
             should_write_bid = (
-                (prev_top is None) or (Decimal(prev_top.amount) != new_price) or (prev_leader != new_leader)
+                (prev_top_amount is None) or (prev_top_amount != new_price) or (prev_leader != new_leader)
             )
             if should_write_bid and new_leader is not None:
                 # new_leader is a bidder_id from compute_current_state
@@ -271,7 +296,7 @@ def manager_approvals(request):
     Shows items in draft state with quick actions to publish.
     """
     items = (
-        Item.objects.select_related("auction", "category", "donor")
+        Item.objects.select_related("category", "donor")
         .filter(status=Item.STATUS_DRAFT)
         .order_by("-created_at")
     )
@@ -293,30 +318,97 @@ def manager_update_item(request, slug):
     return redirect("auctions:manager_approvals")
 
 
+def _shift_quantity_sold(item, delta):
+    """Apply a signed change to a locked item's confirmed-seat counter.
+
+    Item.quantity_sold is the running total of confirmed signup seats, so the
+    fixed-price views adjust it with a single UPDATE instead of re-summing the
+    signups; reconcile_item_counters repairs any drift.
+    """
+    if not delta:
+        return
+    Item.objects.filter(pk=item.pk).update(quantity_sold=Greatest(F("quantity_sold") + delta, 0))
+    item.quantity_sold = max(0, (item.quantity_sold or 0) + delta)
+
+
+def _promote_waitlist(item, remaining):
+    """Confirm waitlisted signups FIFO into ``remaining`` freed seats.
+
+    Each signup is promoted whole or not at all; one that does not fit is
+    skipped so smaller later requests can still take the seats. The rows are
+    locked and picked in Python, then flipped with a single UPDATE. Returns the
+    number of seats promoted.
+    """
+    if remaining <= 0:
+        return 0
+    promote_ids = []
+    promoted = 0
+    waitlisted = (
+        Signup.objects.filter(item=item, waitlisted=True)
+        .order_by("created_at")
+        .select_for_update()
+        .values_list("id", "quantity")
+    )
+    for signup_id, quantity in waitlisted:
+        if quantity <= remaining:
+            promote_ids.append(signup_id)
+            promoted += quantity
+            remaining -= quantity
+        if remaining <= 0:
+            break
+    if promote_ids:
+        Signup.objects.filter(id__in=promote_ids).update(waitlisted=False)
+    return promoted
+
+
+def _signup_ctx(item, user_signup):
+    """Context for the signup partial, built from the already-loaded item."""
+    return {
+        "item": item,
+        "can_signup": item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE,
+        "user_signup": user_signup,
+        "spots_left": item.spots_left,
+    }
+
+
+def _render_signup_section(request, item, user_signup):
+    return render(request, "auctions/partials/signup_section.html", _signup_ctx(item, user_signup))
+
+
+def _load_signup_state(request, slug):
+    """(item, user_signup) read fresh for an error render.
+
+    Used when the item was never locked, or when the transaction failed with
+    an IntegrityError: a concurrent insert (e.g. the uniq_signup_item_user
+    race) committed rows that copies taken under the lock don't show. For
+    other failures the views render from their copies instead of querying
+    again, since the rollback left the rows they read under the lock as is.
+    """
+    item = get_object_or_404(Item, slug=slug)
+    return item, Signup.objects.filter(item=item, user=request.user).first()
+
+
+def _signup_response(request, item, user_signup, is_htmx):
+    """Re-render the signup partial for HTMX requests, else go back to the item page."""
+    if is_htmx:
+        return _render_signup_section(request, item, user_signup)
+    return redirect("auctions:item_detail", slug=item.slug)
+
+
 @login_required
 def fixed_price_adjust(request, slug):
     if request.method != "POST":
         return redirect("auctions:item_detail", slug=slug)
+    is_htmx = request.headers.get("HX-Request") == "true"
+    locked = None
     try:
         with transaction.atomic():
             item = Item.objects.select_for_update().get(slug=slug)
             signup = Signup.objects.filter(item=item, user=request.user).first()
+            locked = (copy(item), copy(signup))
             if not signup:
                 messages.error(request, "You don't have a signup to adjust.")
-                # HTMX: re-render signup section
-                if request.headers.get("HX-Request") == "true":
-                    # recompute context
-                    can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                    user_signup = None
-                    spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-                    ctx = {
-                        "item": item,
-                        "can_signup": can_signup,
-                        "user_signup": user_signup,
-                        "spots_left": spots_left,
-                    }
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
+                return _signup_response(request, item, None, is_htmx)
             try:
                 new_qty = int((request.POST.get("quantity") or "").strip() or "0")
             except Exception:
@@ -325,112 +417,89 @@ def fixed_price_adjust(request, slug):
             old_qty = signup.quantity or 1
             if new_qty == old_qty:
                 messages.info(request, "No changes to your seats.")
-                if request.headers.get("HX-Request") == "true":
-                    # render current state
-                    can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                    spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-                    ctx = {"item": item, "can_signup": can_signup, "user_signup": signup, "spots_left": spots_left}
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
+                return _signup_response(request, item, signup, is_htmx)
 
             # If currently waitlisted, just update quantity; promotion handled elsewhere
             if signup.waitlisted:
                 signup.quantity = new_qty
-                signup.save(update_fields=["quantity"])
+                Signup.objects.filter(pk=signup.pk).update(quantity=new_qty)
                 messages.success(request, "Waitlist quantity updated.")
-                if request.headers.get("HX-Request") == "true":
-                    can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                    spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-                    ctx = {"item": item, "can_signup": can_signup, "user_signup": signup, "spots_left": spots_left}
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
+                return _signup_response(request, item, signup, is_htmx)
 
             # Confirmed signup adjustments
             capacity = item.quantity_total or 0
-            # Current confirmed total (including this signup)
-            current_confirmed = (
-                Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                or 0
-            )
+            # Current confirmed total (including this signup); the item row is locked
+            current_confirmed = item.quantity_sold or 0
 
             if new_qty > old_qty:
                 delta = new_qty - old_qty
-                remaining = max(0, capacity - current_confirmed)
+                remaining = item.spots_left
                 if remaining < delta:
                     messages.error(
                         request,
                         f"Only {remaining} more seat(s) available. Reduce quantity or try later.",
                     )
-                    if request.headers.get("HX-Request") == "true":
-                        can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                        # no state change yet
-                        spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-                        ctx = {"item": item, "can_signup": can_signup, "user_signup": signup, "spots_left": spots_left}
-                        return render(request, "auctions/partials/signup_section.html", ctx)
-                    return redirect("auctions:item_detail", slug=item.slug)
+                    # no state change yet
+                    return _signup_response(request, item, signup, is_htmx)
                 # apply increase
                 signup.quantity = new_qty
-                signup.save(update_fields=["quantity"])
-                item.quantity_sold = current_confirmed + delta
-                item.save(update_fields=["quantity_sold"])
+                Signup.objects.filter(pk=signup.pk).update(quantity=new_qty)
+                _shift_quantity_sold(item, delta)
                 messages.success(request, "Seats increased.")
-                if request.headers.get("HX-Request") == "true":
-                    can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                    spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-                    ctx = {"item": item, "can_signup": can_signup, "user_signup": signup, "spots_left": spots_left}
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
+                return _signup_response(request, item, signup, is_htmx)
             else:
                 # decreasing quantity
                 delta = old_qty - new_qty
                 signup.quantity = new_qty
-                signup.save(update_fields=["quantity"])
-                # recompute confirmed then try to promote waitlist FIFO
-                current_confirmed = (
-                    Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                    or 0
-                )
-                item.quantity_sold = max(0, current_confirmed)
-                remaining = max(0, capacity - item.quantity_sold)
-                if remaining > 0:
-                    waitlisted = list(
-                        Signup.objects.filter(item=item, waitlisted=True)
-                        .order_by("created_at")
-                        .select_for_update()
-                    )
-                    promoted_any = False
-                    for w in waitlisted:
-                        if w.quantity <= remaining:
-                            w.waitlisted = False
-                            w.save(update_fields=["waitlisted"])
-                            item.quantity_sold += w.quantity
-                            remaining -= w.quantity
-                            promoted_any = True
-                        if remaining <= 0:
-                            break
-                    if promoted_any:
-                        messages.info(request, "Waitlisted attendee(s) were promoted.")
-                item.save(update_fields=["quantity_sold"])
+                Signup.objects.filter(pk=signup.pk).update(quantity=new_qty)
+                # then try to promote waitlist FIFO into the freed seats
+                remaining = max(0, capacity - max(0, current_confirmed - delta))
+                promoted = _promote_waitlist(item, remaining)
+                if promoted:
+                    messages.info(request, "Waitlisted attendee(s) were promoted.")
+                _shift_quantity_sold(item, promoted - delta)
                 messages.success(request, "Seats decreased.")
-                if request.headers.get("HX-Request") == "true":
-                    can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                    spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-                    ctx = {"item": item, "can_signup": can_signup, "user_signup": signup, "spots_left": spots_left}
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
-    except Exception:
+                return _signup_response(request, item, signup, is_htmx)
+    except Exception as exc:
         messages.error(request, "Unable to adjust seats right now. Please try again later.")
-        if request.headers.get("HX-Request") == "true":
+        if isinstance(exc, IntegrityError):
+            locked = None  # a concurrent write committed; re-read instead
+        if is_htmx:
             # best-effort partial render
-            item = get_object_or_404(Item, slug=slug)
-            can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-            signup = Signup.objects.filter(item=item, user=request.user).first()
-            spots_left = max(0, (item.quantity_total or 0) - (item.quantity_sold or 0))
-            ctx = {"item": item, "can_signup": can_signup, "user_signup": signup, "spots_left": spots_left}
-            return render(request, "auctions/partials/signup_section.html", ctx)
+            return _render_signup_section(request, *(locked or _load_signup_state(request, slug)))
         return redirect("auctions:item_detail", slug=slug)
 
 
+@lru_cache(maxsize=1)
+def _donor_group_id():
+    """pk of the Donor group, looked up once per process.
+
+    A missing group raises instead of returning None so the miss is not cached
+    and roles seeded after startup are still picked up.
+    """
+    pk = Group.objects.filter(name="Donor").values_list("pk", flat=True).first()
+    if pk is None:
+        raise Group.DoesNotExist
+    return pk
+
+
+def _add_to_donor_group(user):
+    try:
+        gid = _donor_group_id()
+    except Group.DoesNotExist:
+        return
+    try:
+        with transaction.atomic():
+            user.groups.add(gid)
+    except IntegrityError:
+        # The group was recreated since its pk was cached; look it up again
+        _donor_group_id.cache_clear()
+        try:
+            user.groups.add(_donor_group_id())
+        except Group.DoesNotExist:
+            pass
+
+
 def register_view(request):
     if request.method == "POST":
         form = RegisterForm(request.POST)
@@ -443,14 +512,14 @@ def register_view(request):
             except Exception:
                 pass
             messages.success(request, "Welcome! Your account has been created.")
-            # Ensure a profile exists, then redirect to complete it
-            Profile.objects.get_or_create(user=user)
-            # Add user to Donor group if present
+            # The user is brand new, so insert the profile directly rather than
+            # looking it up first; then redirect to complete it
             try:
-                donor_group = Group.objects.get(name="Donor")
-                donor_group.user_set.add(user)
-            except Group.DoesNotExist:
+                with transaction.atomic():
+                    Profile.objects.create(user=user)
+            except IntegrityError:
                 pass
+            _add_to_donor_group(user)
             return redirect("auctions:profile_complete")
     else:
         form = RegisterForm()
@@ -477,11 +546,9 @@ def login_view(request):
         if form.is_valid():
             email = form.cleaned_data["email"].strip().lower()
             password = form.cleaned_data["password"]
-            # Try email-based auth first
+            # Email is the username field, so one pass covers legacy username==email
+            # logins too; a second call would only re-run the password hash.
             user = authenticate(request, email=email, password=password)
-            # Fall back to username-based auth for legacy users where username==email
-            if user is None:
-                user = authenticate(request, username=email, password=password)
             if user is not None:
                 login(request, user)
                 return redirect("auctions:catalog_list")
@@ -501,144 +568,116 @@ def account_home(request):
     return render(request, "auctions/account_home.html", {})
 
 
+# Columns the account tab rows render; the tabs never show descriptions or images
+_ACCOUNT_TAB_FIELDS = ("slug", "title", "status", "type", "category__name")
+
+
 @login_required
 def account_tab_offered(request):
     """Items offered/donated by the current user."""
     items = (
-        Item.objects.select_related("auction", "category")
+        Item.objects.select_related("category")
+        .only(*_ACCOUNT_TAB_FIELDS)
         .filter(donor=request.user)
         .order_by("-created_at")
     )
     return render(request, "auctions/partials/account_tab_offered.html", {"items": items})
 
 
-@login_required
-def account_tab_winning(request):
-    """Items where the user is currently winning one or more seats."""
-    from .models import ProxyBid, Bid  # local import
+def _bid_increment(item, base):
+    """The item's fixed increment if it has one, else the standard tier for ``base``."""
+    return item.bid_increment if item.bid_increment is not None else standard_increment(base)
 
-    def get_increment(base: Decimal, item: Item) -> Decimal:
-        return item.bid_increment if item.bid_increment is not None else standard_increment(base)
 
-    def compute_current_state(locked_item: Item):
-        proxies = list(
-            ProxyBid.objects.filter(item=locked_item).order_by("-max_amount", "updated_at")
-        )
-        opening = Decimal(locked_item.opening_min_bid or Decimal("1.00"))
-        K = max(1, int(locked_item.quantity_total or 1))
-        units = []  # (amount, updated_at, bidder_id)
-        for p in proxies:
-            seats = max(1, int(getattr(p, "seats", 1) or 1))
-            amt = Decimal(p.max_amount)
-            for _ in range(seats):
-                units.append((amt, p.updated_at, p.bidder_id))
-        if not units:
-            return None, opening, False, {}
-        units.sort(key=lambda t: (t[0] * -1, t[1]))
-        if len(units) <= K:
-            winners_map = {}
-            for _, __, bidder_id in units:
-                winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-            top_bidder = units[0][2]
-            return top_bidder, opening, False, winners_map
-        kth_max = Decimal(units[K - 1][0])
-        next_max = Decimal(units[K][0])
-        inc = Decimal(get_increment(next_max, locked_item))
-        price = min(kth_max, next_max + inc)
-        price = max(price, opening)
-        winners_map = {}
-        for i in range(K):
-            _, __, bidder_id = units[i]
-            winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-        top_bidder = units[0][2]
-        return top_bidder, price, True, winners_map
-
-    # Candidate items: where user has a proxy or has bid on; exclude fixed-price
-    items_qs = (
-        Item.objects.select_related("auction", "category")
+def _proxy_state(item, proxies):
+    """uniform_price_outcome for ``item`` from (max_amount, updated_at, bidder_id, seats) rows.
+
+    Returns (top_bidder_id, public_price, is_full, winners_map).
+    """
+    return uniform_price_outcome(
+        proxies,
+        item.opening_min_bid or _DEFAULT_OPENING_BID,
+        max(1, int(item.quantity_total or 1)),
+        partial(_bid_increment, item),
+    )
+
+
+def _proxy_rows(proxies):
+    """_proxy_state rows from ProxyBid instances."""
+    return [(p.max_amount, p.updated_at, p.bidder_id, p.seats) for p in proxies]
+
+
+def _my_bid_items(user):
+    """Items the user has bid on, as (winning, outbid) by whether they win seats.
+
+    Loads the proxies for those items in one query and prices each item in
+    memory, instead of one proxy query (plus one for the user's max) per item.
+    A running seat total ranks proxies in SQL so only the rows holding the
+    first K+1 units come back; ``_proxy_state`` never looks past those.
+    """
+    items = list(
+        Item.objects.select_related("category")
+        .only(*_ACCOUNT_TAB_FIELDS, "opening_min_bid", "quantity_total", "bid_increment")
         .exclude(type=Item.TYPE_FIXED_PRICE)
         .filter(
-            Q(proxy_bids__bidder=request.user) | Q(bids__bidder=request.user)
+            pk__in=ProxyBid.objects.filter(bidder=user)
+            .order_by()
+            .values("item_id")
+            .union(Bid.objects.filter(bidder=user).order_by().values("item_id"))
+        )
+        .annotate(
+            my_max=Subquery(
+                ProxyBid.objects.filter(item=OuterRef("pk"), bidder=user).order_by().values("max_amount")[:1]
+            )
         )
         .order_by("title")
-        .distinct()
     )
-    items = []
-    # Annotate each item with my_won_seats, current_price, my_max
-    for it in items_qs:
-        _, public_price, _, winners_map = compute_current_state(it)
-        my_won = winners_map.get(request.user.id, 0)
+    units = Greatest(F("seats"), 1)
+    ranked = (
+        ProxyBid.objects.filter(item__in=[it.pk for it in items])
+        .annotate(
+            seats_before=Window(
+                Sum(units),
+                partition_by=[F("item_id")],
+                order_by=[F("max_amount").desc(), F("updated_at").asc(), F("id").asc()],
+            )
+            - units,
+            k=Greatest(Coalesce("item__quantity_total", 1), 1),
+        )
+        .filter(seats_before__lte=F("k"))
+        .order_by()
+    )
+    by_item = defaultdict(list)
+    for item_id, *row in ranked.values_list("item_id", "max_amount", "updated_at", "bidder_id", "seats"):
+        by_item[item_id].append(row)
+    winning, outbid = [], []
+    for it in items:
+        _, public_price, _, winners_map = _proxy_state(it, by_item[it.pk])
+        it.current_price = public_price
+        my_won = winners_map.get(user.id, 0)
         if my_won > 0:
             it.my_won_seats = my_won
-            it.current_price = public_price
-            it.my_max = (
-                ProxyBid.objects.filter(item=it, bidder=request.user).values_list("max_amount", flat=True).first()
-            )
-            items.append(it)
-    return render(request, "auctions/partials/account_tab_winning.html", {"items": items})
+            winning.append(it)
+        else:
+            outbid.append(it)
+    return winning, outbid
+
+
+def _render_bid_tab(request, winning, items):
+    template = "account_tab_winning.html" if winning else "account_tab_outbid.html"
+    return render(request, f"auctions/partials/{template}", {"items": items})
 
 
 @login_required
-def account_tab_outbid(request):
-    """Items the user has bid on but is currently winning 0 seats."""
-    from .models import ProxyBid, Bid  # local import
+def account_tab_winning(request):
+    """Items where the user is currently winning one or more seats."""
+    return _render_bid_tab(request, True, _my_bid_items(request.user)[0])
 
-    def get_increment(base: Decimal, item: Item) -> Decimal:
-        return item.bid_increment if item.bid_increment is not None else standard_increment(base)
 
-    def compute_current_state(locked_item: Item):
-        proxies = list(
-            ProxyBid.objects.filter(item=locked_item).order_by("-max_amount", "updated_at")
-        )
-        opening = Decimal(locked_item.opening_min_bid or Decimal("1.00"))
-        K = max(1, int(locked_item.quantity_total or 1))
-        units = []
-        for p in proxies:
-            seats = max(1, int(getattr(p, "seats", 1) or 1))
-            amt = Decimal(p.max_amount)
-            for _ in range(seats):
-                units.append((amt, p.updated_at, p.bidder_id))
-        if not units:
-            return None, opening, False, {}
-        units.sort(key=lambda t: (t[0] * -1, t[1]))
-        if len(units) <= K:
-            winners_map = {}
-            for _, __, bidder_id in units:
-                winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-            top_bidder = units[0][2]
-            return top_bidder, opening, False, winners_map
-        kth_max = Decimal(units[K - 1][0])
-        next_max = Decimal(units[K][0])
-        inc = Decimal(get_increment(next_max, locked_item))
-        price = min(kth_max, next_max + inc)
-        price = max(price, opening)
-        winners_map = {}
-        for i in range(K):
-            _, __, bidder_id = units[i]
-            winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-        top_bidder = units[0][2]
-        return top_bidder, price, True, winners_map
-
-    items_qs = (
-        Item.objects.select_related("auction", "category")
-        .exclude(type=Item.TYPE_FIXED_PRICE)
-        .filter(
-            Q(proxy_bids__bidder=request.user) | Q(bids__bidder=request.user)
-        )
-        .order_by("title")
-        .distinct()
-    )
-    items = []
-    for it in items_qs:
-        _, public_price, _, winners_map = compute_current_state(it)
-        my_won = winners_map.get(request.user.id, 0)
-        if my_won == 0:
-            it.current_price = public_price
-            it.my_max = (
-                ProxyBid.objects.filter(item=it, bidder=request.user).values_list("max_amount", flat=True).first()
-            )
-            items.append(it)
-    return render(request, "auctions/partials/account_tab_outbid.html", {"items": items})
+@login_required
+def account_tab_outbid(request):
+    """Items the user has bid on but is currently winning 0 seats."""
+    return _render_bid_tab(request, False, _my_bid_items(request.user)[1])
 
 
 @login_required
@@ -650,8 +689,9 @@ def account_update_proxy_max(request, slug):
     """
     if request.method != "POST":
         return redirect("auctions:account_home")
+    is_htmx = request.headers.get("HX-Request") == "true"
 
-    item = get_object_or_404(Item.objects.select_related("auction"), slug=slug)
+    item = get_object_or_404(Item, slug=slug)
     if item.status != Item.STATUS_PUBLISHED or item.type == Item.TYPE_FIXED_PRICE:
         messages.error(request, "Bidding is not allowed on this item.")
         return redirect("auctions:account_home")
@@ -663,76 +703,58 @@ def account_update_proxy_max(request, slug):
         messages.error(request, "Enter a valid amount.")
         return redirect("auctions:account_home")
 
-    def get_increment(base: Decimal) -> Decimal:
-        return item.bid_increment if item.bid_increment is not None else standard_increment(base)
-
-    def compute_current_state(locked_item):
-        from .models import ProxyBid  # local import
-        proxies = list(
-            ProxyBid.objects.filter(item=locked_item).select_for_update().order_by("-max_amount", "updated_at")
-        )
-        opening = Decimal(locked_item.opening_min_bid or Decimal("1.00"))
-        K = int(locked_item.quantity_total or 1)
-        K = max(1, K)
-        units = []
-        for p in proxies:
-            seats = max(1, int(getattr(p, "seats", 1) or 1))
-            amt = Decimal(p.max_amount)
-            for _ in range(seats):
-                units.append((amt, p.updated_at, p.bidder_id))
-        if not units:
-            return None, opening, False, {}
-        units.sort(key=lambda t: (t[0] * -1, t[1]))
-        if len(units) <= K:
-            winners_map = {}
-            for _, __, bidder_id in units[:]:
-                winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-            top_bidder = proxies[0].bidder if proxies else None
-            return top_bidder, opening, False, winners_map
-        kth_max = Decimal(units[K - 1][0])
-        next_max = Decimal(units[K][0])
-        inc = Decimal(get_increment(next_max))
-        price = min(kth_max, next_max + inc)
-        price = max(price, opening)
-        winners_map = {}
-        for i in range(K):
-            _, __, bidder_id = units[i]
-            winners_map[bidder_id] = winners_map.get(bidder_id, 0) + 1
-        top_bidder = units[0][2]
-        return top_bidder, price, True, winners_map
+    # This form can only raise a maximum; a resubmitted or lower amount leaves
+    # the auction unchanged, so answer it without taking any locks.
+    current_max = (
+        ProxyBid.objects.filter(item=item, bidder=request.user).values_list("max_amount", flat=True).first()
+    )
+    if current_max is not None and new_max <= current_max:
+        if is_htmx:
+            # Refresh the tab the user's standing belongs in, without a message
+            # (see the HTMX response below); one pricing pass serves both.
+            winning, outbid = _my_bid_items(request.user)
+            if any(it.pk == item.pk for it in winning):
+                return _render_bid_tab(request, True, winning)
+            return _render_bid_tab(request, False, outbid)
+        messages.info(request, f"Your maximum is already {current_max}. Enter a higher amount to raise it.")
+        return redirect("auctions:account_home")
 
     try:
         with transaction.atomic():
             locked_item = Item.objects.select_for_update().get(pk=item.pk)
-            from .models import ProxyBid, Bid  # local import
 
-            prev_top = locked_item.bids.order_by("-amount", "-created_at").first()
-            prev_leader, prev_price, prev_full, prev_winners = compute_current_state(locked_item)
+            # Top bid amount from the locked row (trigger-maintained), no bids query
+            prev_top_amount = locked_item.current_bid_amount
+            # Proxy writes are serialized by the Item lock; see place_bid
+            proxies = list(ProxyBid.objects.filter(item=locked_item))
+            prev_leader, prev_price, prev_full, prev_winners = _proxy_state(locked_item, _proxy_rows(proxies))
 
             # opening minimum validation when not full previously
             if not prev_full:
-                opening_req = Decimal(locked_item.opening_min_bid or Decimal("1.00"))
+                opening_req = locked_item.opening_min_bid or _DEFAULT_OPENING_BID
                 if new_max < opening_req:
                     messages.error(request, f"Your maximum must be at least {opening_req}.")
                     return redirect("auctions:account_home")
 
-            pb, created = ProxyBid.objects.select_for_update().get_or_create(
-                item=locked_item, bidder=request.user, defaults={"max_amount": new_max}
-            )
-            if not created and new_max > pb.max_amount:
-                pb.max_amount = new_max
+            pb = next((p for p in proxies if p.bidder_id == request.user.id), None)
+            created = pb is None
+            if created:
+                pb = ProxyBid.objects.create(item=locked_item, bidder=request.user, max_amount=new_max.quantize(_CENT))
+                proxies.append(pb)
+            elif new_max > pb.max_amount:
+                pb.max_amount = new_max.quantize(_CENT)
                 pb.save(update_fields=["max_amount", "updated_at"])
 
-            new_leader, new_price, new_full, new_winners = compute_current_state(locked_item)
+            new_leader, new_price, new_full, new_winners = _proxy_state(locked_item, _proxy_rows(proxies))
 
             if prev_full and (new_winners.get(request.user.id, 0) == 0):
-                min_next = prev_price + Decimal(get_increment(prev_price))
+                min_next = prev_price + _bid_increment(item, prev_price)
                 if new_max < min_next and (not created and new_max <= pb.max_amount):
                     messages.error(request, f"Your maximum must be at least {min_next} to secure a spot.")
                     return redirect("auctions:account_home")
 
             should_write_bid = (
-                (prev_top is None) or (Decimal(prev_top.amount) != new_price) or (prev_leader != new_leader)
+                (prev_top_amount is None) or (prev_top_amount != new_price) or (prev_leader != new_leader)
             )
             if should_write_bid and new_leader is not None:
                 # new_leader is a bidder_id from compute_current_state
@@ -740,7 +762,7 @@ def account_update_proxy_max(request, slug):
 
     except Exception:
         messages.error(request, "Unable to update your maximum right now. Please try again.")
-        if request.headers.get("HX-Request") == "true":
+        if is_htmx:
             # best-effort refresh
             return account_tab_winning(request)
         return redirect("auctions:account_home")
@@ -752,6 +774,14 @@ def account_update_proxy_max(request, slug):
     except Exception:
         prev_won = 0
         new_won = 0
+
+    if is_htmx:
+        # The refreshed tab is the feedback; the tab partials carry no flash
+        # area, so a message here would only resurface on a later page load.
+        if new_won > 0:
+            return account_tab_winning(request)
+        else:
+            return account_tab_outbid(request)
     if new_won > 0:
         if prev_won > 0:
             messages.success(request, f"Your maximum was updated. You're still winning {new_won} seat(s).")
@@ -759,13 +789,6 @@ def account_update_proxy_max(request, slug):
             messages.success(request, f"You're now winning {new_won} seat(s).")
     else:
         messages.info(request, "Your maximum was recorded, but you're not winning a seat yet.")
-
-    if request.headers.get("HX-Request") == "true":
-        # Refresh appropriate tab based on current outcome
-        if new_won > 0:
-            return account_tab_winning(request)
-        else:
-            return account_tab_outbid(request)
     return redirect("auctions:account_home")
 
 
@@ -776,12 +799,11 @@ def donor_item_create(request):
         if form.is_valid():
             item = form.save(commit=False)
             # assign latest auction and donor
-            item.auction = Auction.objects.order_by("-year").first()
+            item.auction_id = Auction.current_id()
             item.donor = request.user
             item.status = Item.STATUS_DRAFT
-            # generate a slug from title
-            item.slug = unique_slug(Item, form.cleaned_data["title"])
-            item.save()
+            # slug from title, suffixed only if the title is already taken
+            save_with_unique_slug(item, form.cleaned_data["title"])
             messages.success(request, "Draft item created.")
             return redirect("auctions:donor_item_edit", slug=item.slug)
     else:
@@ -824,28 +846,19 @@ def manager_publish_item(request, slug):
 def fixed_price_signup(request, slug):
     if request.method != "POST":
         return redirect("auctions:item_detail", slug=slug)
+    is_htmx = request.headers.get("HX-Request") == "true"
+    locked = None
     try:
         with transaction.atomic():
-            item = (
-                Item.objects.select_for_update().select_related("auction").get(slug=slug)
-            )
+            item = Item.objects.select_for_update().get(slug=slug)
             if item.type != Item.TYPE_FIXED_PRICE or item.status != Item.STATUS_PUBLISHED:
                 messages.error(request, "Signups are not allowed for this item.")
                 return redirect("auctions:item_detail", slug=item.slug)
             existing = Signup.objects.filter(item=item, user=request.user).first()
+            locked = (copy(item), existing)
             if existing:
                 messages.success(request, "You're signed up.")
-                if request.headers.get("HX-Request") == "true":
-                    capacity = item.quantity_total or 0
-                    confirmed_sum = (
-                        Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                        or 0
-                    )
-                    item.quantity_sold = confirmed_sum
-                    spots_left = max(0, capacity - confirmed_sum)
-                    ctx = {"item": item, "can_signup": True, "user_signup": existing, "spots_left": spots_left}
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
+                return _signup_response(request, item, existing, is_htmx)
             # desired quantity (default 1)
             try:
                 qty = int(request.POST.get("quantity", "1"))
@@ -853,47 +866,25 @@ def fixed_price_signup(request, slug):
                 qty = 1
             qty = max(1, qty)
 
-            capacity = item.quantity_total or 0
-            confirmed_sum = (
-                Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                or 0
-            )
-            remaining = max(0, capacity - confirmed_sum)
+            # The locked item's counter is the confirmed total; no need to re-sum signups
+            remaining = item.spots_left
 
             if remaining >= qty:
                 user_signup = Signup.objects.create(item=item, user=request.user, waitlisted=False, quantity=qty)
-                item.quantity_sold = (confirmed_sum + qty)
-                item.save(update_fields=["quantity_sold"])
+                _shift_quantity_sold(item, qty)
                 messages.success(request, "Signup confirmed.")
             else:
                 # Not enough space; place entire request on waitlist
                 user_signup = Signup.objects.create(item=item, user=request.user, waitlisted=True, quantity=qty)
                 messages.info(request, "Waitlisted. You'll be promoted if a spot opens.")
-            if request.headers.get("HX-Request") == "true":
-                capacity = item.quantity_total or 0
-                confirmed_sum = (
-                    Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                    or 0
-                )
-                item.quantity_sold = confirmed_sum
-                spots_left = max(0, capacity - confirmed_sum)
-                ctx = {"item": item, "can_signup": True, "user_signup": user_signup, "spots_left": spots_left}
-                return render(request, "auctions/partials/signup_section.html", ctx)
-    except Exception:
+            if is_htmx:
+                return _render_signup_section(request, item, user_signup)
+    except Exception as exc:
         messages.error(request, "Signup temporarily unavailable. Please try again later.")
-    if request.headers.get("HX-Request") == "true":
-        item = get_object_or_404(Item, slug=slug)
-        can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-        user_signup = Signup.objects.filter(item=item, user=request.user).first()
-        capacity = item.quantity_total or 0
-        confirmed_sum = (
-            Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-            or 0
-        )
-        item.quantity_sold = confirmed_sum
-        spots_left = max(0, capacity - confirmed_sum)
-        ctx = {"item": item, "can_signup": can_signup, "user_signup": user_signup, "spots_left": spots_left}
-        return render(request, "auctions/partials/signup_section.html", ctx)
+        if isinstance(exc, IntegrityError):
+            locked = None  # a concurrent write committed; re-read instead
+    if is_htmx:
+        return _render_signup_section(request, *(locked or _load_signup_state(request, slug)))
     return redirect("auctions:item_detail", slug=slug)
 
 
@@ -908,34 +899,17 @@ def send_test_sms(request):
     """
     if request.method != "POST":
         return JsonResponse({"error": "POST required"}, status=405)
-    import os
     to = (request.POST.get("to") or "").strip()
     if not to:
         return JsonResponse({"error": "Missing 'to' parameter"}, status=400)
     text = (request.POST.get("text") or "Test from auction app").strip()
-    api_key = os.environ.get("TELNYX_API_KEY")
-    profile_id = os.environ.get("TELNYX_MESSAGING_PROFILE_ID")
-    from_number = os.environ.get("TELNYX_FROM_NUMBER")
-    if not api_key:
+    if not settings.TELNYX_API_KEY:
         return JsonResponse({"error": "TELNYX_API_KEY not configured"}, status=500)
-    if not (profile_id or from_number):
+    if not (settings.TELNYX_MESSAGING_PROFILE_ID or settings.TELNYX_FROM_NUMBER):
         return JsonResponse({"error": "TELNYX_MESSAGING_PROFILE_ID or TELNYX_FROM_NUMBER must be set"}, status=500)
     try:
-        import telnyx
-        telnyx.api_key = api_key
-        if profile_id:
-            msg = telnyx.Message.create(
-                to=to,
-                messaging_profile_id=profile_id,
-                text=text,
-            )
-        else:
-            msg = telnyx.Message.create(
-                to=to,
-                from_=from_number,
-                text=text,
-            )
-        return JsonResponse({"ok": True, "message_id": getattr(msg, "id", None)}, status=200)
+        message_id = send_sms(to, text)
+        return JsonResponse({"ok": True, "message_id": message_id}, status=200)
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
@@ -944,68 +918,34 @@ def send_test_sms(request):
 def fixed_price_cancel(request, slug):
     if request.method != "POST":
         return redirect("auctions:item_detail", slug=slug)
+    is_htmx = request.headers.get("HX-Request") == "true"
+    locked = None
     try:
         with transaction.atomic():
             item = Item.objects.select_for_update().get(slug=slug)
             signup = Signup.objects.filter(item=item, user=request.user).first()
+            locked = (copy(item), copy(signup))
             if not signup:
-                if request.headers.get("HX-Request") == "true":
-                    can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-                    user_signup = None
-                    capacity = item.quantity_total or 0
-                    confirmed_sum = (
-                        Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                        or 0
-                    )
-                    item.quantity_sold = confirmed_sum
-                    spots_left = max(0, capacity - confirmed_sum)
-                    ctx = {"item": item, "can_signup": can_signup, "user_signup": user_signup, "spots_left": spots_left}
-                    return render(request, "auctions/partials/signup_section.html", ctx)
-                return redirect("auctions:item_detail", slug=item.slug)
+                return _signup_response(request, item, None, is_htmx)
             was_waitlisted = signup.waitlisted
             freed_qty = signup.quantity or 1
             signup.delete()
             if not was_waitlisted:
                 # free slots, decrement sold then try to promote waitlist FIFO if capacity allows
-                current_confirmed = (
-                    Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-                    or 0
-                )
-                item.quantity_sold = max(0, current_confirmed)
                 capacity = item.quantity_total or 0
-                remaining = max(0, capacity - item.quantity_sold)
-                if remaining > 0:
-                    # Promote as many waitlisted signups as possible fully (no partial promotion)
-                    waitlisted = list(
-                        Signup.objects.filter(item=item, waitlisted=True).order_by("created_at").select_for_update()
-                    )
-                    promoted_any = False
-                    for w in waitlisted:
-                        if w.quantity <= remaining:
-                            w.waitlisted = False
-                            w.save(update_fields=["waitlisted"])
-                            item.quantity_sold += w.quantity
-                            remaining -= w.quantity
-                            promoted_any = True
-                        if remaining <= 0:
-                            break
-                    if promoted_any:
-                        messages.info(request, "Waitlisted attendee(s) were promoted.")
-                item.save(update_fields=["quantity_sold"])
+                remaining = max(0, capacity - max(0, (item.quantity_sold or 0) - freed_qty))
+                # Promote as many waitlisted signups as possible fully (no partial promotion)
+                promoted = _promote_waitlist(item, remaining)
+                if promoted:
+                    messages.info(request, "Waitlisted attendee(s) were promoted.")
+                _shift_quantity_sold(item, promoted - freed_qty)
         messages.success(request, "Your signup was canceled.")
-    except Exception:
+        if is_htmx:
+            return _render_signup_section(request, item, None)
+    except Exception as exc:
         messages.error(request, "Unable to cancel at this time. Please try again later.")
-    if request.headers.get("HX-Request") == "true":
-        item = get_object_or_404(Item, slug=slug)
-        can_signup = item.status == Item.STATUS_PUBLISHED and item.type == Item.TYPE_FIXED_PRICE
-        user_signup = Signup.objects.filter(item=item, user=request.user).first()
-        capacity = item.quantity_total or 0
-        confirmed_sum = (
-            Signup.objects.filter(item=item, waitlisted=False).aggregate(s=Sum("quantity")).get("s")
-            or 0
-        )
-        item.quantity_sold = confirmed_sum
-        spots_left = max(0, capacity - confirmed_sum)
-        ctx = {"item": item, "can_signup": can_signup, "user_signup": user_signup, "spots_left": spots_left}
-        return render(request, "auctions/partials/signup_section.html", ctx)
+        if isinstance(exc, IntegrityError):
+            locked = None  # a concurrent write committed; re-read instead
+    if is_htmx:
+        return _render_signup_section(request, *(locked or _load_signup_state(request, slug)))
     return redirect("auctions:item_detail", slug=slug)
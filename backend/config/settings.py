@@ -61,6 +61,10 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASES = {
     'default': env.db('DATABASE_URL', default='sqlite:///db.sqlite3')
 }
+# Reuse connections across requests instead of reconnecting each time; health
+# checks drop connections the server has closed before they are reused.
+DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=600)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
 
 CACHES = {
     'default': {
@@ -69,6 +73,10 @@ CACHES = {
     }
 }
 
+# Sessions are read on every request; serve them from Redis and fall back to
+# the database on a cache miss.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -104,11 +112,22 @@ CSRF_TRUSTED_ORIGINS = env.list(
 # Celery
 CELERY_BROKER_URL = env('REDIS_URL', default='redis://127.0.0.1:6379/1')
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+# Off by default so environments without a worker keep running tasks inline
+CELERY_ENABLED = env.bool('CELERY_ENABLED', default=False)
+
+# Telnyx SMS
+TELNYX_API_KEY = env('TELNYX_API_KEY', default='')
+TELNYX_MESSAGING_PROFILE_ID = env('TELNYX_MESSAGING_PROFILE_ID', default='')
+TELNYX_FROM_NUMBER = env('TELNYX_FROM_NUMBER', default='')
+# Seconds before a Telnyx API call gives up (the SDK's own default is 80)
+TELNYX_TIMEOUT = env.int('TELNYX_TIMEOUT', default=10)
 
 # Auth settings
+# EmailBackend subclasses ModelBackend (permissions included) and matches the
+# email case-insensitively, so listing ModelBackend too would only hash a
+# rejected password a second time.
 AUTHENTICATION_BACKENDS = [
     'auctions.auth_backends.EmailBackend',
-    'django.contrib.auth.backends.ModelBackend',
 ]
 LOGIN_URL = 'auctions:login'
 LOGIN_REDIRECT_URL = 'auctions:catalog_list'
@@ -120,6 +139,7 @@ AUTH_USER_MODEL = 'accounts.User'
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
 # reCAPTCHA configuration
+ENABLE_RECAPTCHA = env.bool('ENABLE_RECAPTCHA', default=True)
 RECAPTCHA_PUBLIC_KEY = env('RECAPTCHA_PUBLIC_KEY', default='')
 RECAPTCHA_PRIVATE_KEY = env('RECAPTCHA_PRIVATE_KEY', default='')
 
@@ -0,0 +1,81 @@
+import pytest
+from django.core.management import call_command
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    # Seed the Donor/Manager groups once for the whole run; each test's
+    # rollback leaves them in place (and a reused database keeps them)
+    with django_db_blocker.unblock():
+        call_command("bootstrap_roles", verbosity=0)
+
+
+@pytest.fixture(autouse=True)
+def _disable_recaptcha(settings):
+    # Registration tests post without a reCAPTCHA token
+    settings.ENABLE_RECAPTCHA = False
+
+
+@pytest.fixture(autouse=True)
+def _fast_password_hasher(settings):
+    # The production PBKDF2 work factor dominates auth-heavy tests
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@pytest.fixture(autouse=True)
+def _local_cache(settings):
+    # Keep tests (cached sessions included) off the Redis cache, starting empty
+    # since LocMemCache storage outlives each test's database rollback
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_donor_group_cache():
+    # A test may delete and recreate the groups, giving them new pks
+    from auctions.views import _donor_group_id
+
+    _donor_group_id.cache_clear()
+    yield
+    _donor_group_id.cache_clear()
+
+
+@pytest.fixture
+def fp_item(db):
+    """Factory for a published fixed-price item in its own auction and category."""
+    from decimal import Decimal
+
+    from auctions.models import Auction, Category, Item
+
+    def make(slug, title, quantity_total, price=None):
+        auction = Auction.objects.create(year=2029, slug="auction-2029", title="Auction 2029")
+        category = Category.objects.create(name="Events", slug="events")
+        return Item.objects.create(
+            auction=auction,
+            category=category,
+            type=Item.TYPE_FIXED_PRICE,
+            slug=slug,
+            title=title,
+            status=Item.STATUS_PUBLISHED,
+            buy_now_price=Decimal(price) if price is not None else None,
+            quantity_total=quantity_total,
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_users(db):
+    """Insert users for the given emails in one query, all with password "p"."""
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+
+    User = get_user_model()
+    password = make_password("p")
+
+    def make(*emails):
+        return User.objects.bulk_create([User(email=email, password=password) for email in emails])
+
+    return make
@@ -46,3 +46,42 @@ def test_account_requires_login(client):
     resp = client.get(reverse("auctions:account_home"))
     assert resp.status_code in (302, 301)
     assert reverse("auctions:login") in resp.headers.get("Location", "")
+
+
+def test_register_form_captcha_follows_setting(settings):
+    from auctions.forms import RegisterForm
+
+    assert "captcha" not in RegisterForm().fields
+    settings.ENABLE_RECAPTCHA = True
+    assert "captcha" in RegisterForm().fields
+
+
+@pytest.mark.django_db
+def test_wrong_password_is_hashed_once(client, monkeypatch):
+    User.objects.create_user(email="test@example.org", password="secret12345")
+    calls = []
+    original = User.check_password
+
+    def counting_check_password(self, raw_password):
+        calls.append(raw_password)
+        return original(self, raw_password)
+
+    monkeypatch.setattr(User, "check_password", counting_check_password)
+    resp = client.post(reverse("auctions:login"), {"email": "Test@example.org", "password": "wrong"})
+    assert resp.status_code == 200
+    assert calls == ["wrong"]
+
+
+@pytest.mark.django_db
+def test_unknown_email_still_hashes_once(client, monkeypatch):
+    calls = []
+    original = User.set_password
+
+    def counting_set_password(self, raw_password):
+        calls.append(raw_password)
+        return original(self, raw_password)
+
+    monkeypatch.setattr(User, "set_password", counting_set_password)
+    resp = client.post(reverse("auctions:login"), {"email": "nobody@example.org", "password": "wrong"})
+    assert resp.status_code == 200
+    assert calls == ["wrong"]
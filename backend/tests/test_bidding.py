@@ -79,3 +79,252 @@ def test_idempotent_bid_submission(client):
     )
     assert r2.status_code == 200
     assert Bid.objects.filter(item=item, bidder=user).count() == 1
+
+
+@pytest.mark.django_db
+def test_account_tabs_split_winning_and_outbid(client, django_assert_max_num_queries):
+    from auctions.models import ProxyBid
+
+    a = Auction.objects.create(year=2027, slug="auction-2027", title="Auction 2027")
+    me = User.objects.create_user(email="me@example.org", password="p")
+    rival = User.objects.create_user(email="rival@example.org", password="p")
+    items = [
+        Item.objects.create(
+            auction=a, type=Item.TYPE_GOOD, slug=f"vase-{n}", title=f"Vase {n}",
+            status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"),
+        )
+        for n in range(4)
+    ]
+    for it in items:
+        ProxyBid.objects.create(item=it, bidder=me, max_amount=Decimal("20.00"))
+    # Outbid on the last two
+    for it in items[2:]:
+        ProxyBid.objects.create(item=it, bidder=rival, max_amount=Decimal("30.00"))
+    client.force_login(me)
+
+    # Proxies for every item arrive in one query, not one (or two) per item
+    with django_assert_max_num_queries(5):
+        winning = client.get(reverse("auctions:account_tab_winning")).context["items"]
+    assert [(it.slug, it.current_price, it.my_max, it.my_won_seats) for it in winning] == [
+        ("vase-0", Decimal("10.00"), Decimal("20.00"), 1),
+        ("vase-1", Decimal("10.00"), Decimal("20.00"), 1),
+    ]
+    outbid = client.get(reverse("auctions:account_tab_outbid")).context["items"]
+    # Price is the runner-up max plus one increment ($1 below $25)
+    assert [(it.slug, it.current_price, it.my_max) for it in outbid] == [
+        ("vase-2", Decimal("21.00"), Decimal("20.00")),
+        ("vase-3", Decimal("21.00"), Decimal("20.00")),
+    ]
+
+
+def _expanded_state(item, proxies):
+    # Reference: the original one-entry-per-seat expansion
+    opening = item.opening_min_bid or Decimal("1.00")
+    K = max(1, int(item.quantity_total or 1))
+    units = sorted(
+        ((amt, ts, bidder) for amt, ts, bidder, seats in proxies for _ in range(max(1, seats or 1))),
+        key=lambda u: (-u[0], u[1]),
+    )
+    if not units:
+        return None, opening, False, {}
+    winners = {}
+    for _, __, bidder in units[:K]:
+        winners[bidder] = winners.get(bidder, 0) + 1
+    if len(units) <= K:
+        return units[0][2], opening, False, winners
+    from auctions.utils import standard_increment
+
+    inc = item.bid_increment if item.bid_increment is not None else standard_increment(units[K][0])
+    return units[0][2], max(min(units[K - 1][0], units[K][0] + inc), opening), True, winners
+
+
+def test_proxy_state_matches_per_seat_expansion():
+    import random
+    from datetime import datetime, timedelta
+
+    from auctions.views import _proxy_state
+
+    rng = random.Random(7)
+    t0 = datetime(2025, 1, 1)
+    for _ in range(500):
+        item = Item(
+            quantity_total=rng.randint(1, 8),
+            opening_min_bid=rng.choice([None, Decimal("5.00"), Decimal("40.00")]),
+            bid_increment=rng.choice([None, Decimal("2.50")]),
+        )
+        proxies = [
+            (Decimal(rng.randint(1, 12) * 5), t0 + timedelta(minutes=rng.randint(0, 3)), bidder, rng.randint(1, 4))
+            for bidder in range(rng.randint(0, 6))
+        ]
+        assert _proxy_state(item, proxies) == _expanded_state(item, proxies)
+
+
+def test_proxy_state_top_k_selection_matches_expansion():
+    import random
+    from datetime import datetime, timedelta
+
+    from auctions.views import _proxy_state
+
+    # Many proxies competing for few seats take the partial-selection path
+    rng = random.Random(11)
+    t0 = datetime(2025, 1, 1)
+    for _ in range(300):
+        item = Item(quantity_total=rng.randint(1, 3), opening_min_bid=Decimal("5.00"))
+        proxies = [
+            (Decimal(rng.randint(1, 8) * 5), t0 + timedelta(seconds=rng.randint(0, 5)), bidder, rng.randint(1, 3))
+            for bidder in range(rng.randint(10, 40))
+        ]
+        assert _proxy_state(item, proxies) == _expanded_state(item, proxies)
+
+
+@pytest.mark.django_db
+def test_first_proxy_from_account_page_records_bid(client):
+    a = Auction.objects.create(year=2028, slug="auction-2028", title="Auction 2028")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_GOOD, slug="rug", title="Rug",
+        status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"),
+    )
+    user = User.objects.create_user(email="d@example.org", password="p")
+    client.force_login(user)
+    client.post(reverse("auctions:account_update_proxy_max", kwargs={"slug": item.slug}), {"amount": "15.00"})
+    bid = Bid.objects.get(item=item)
+    assert (bid.bidder_id, bid.amount) == (user.id, Decimal("10.00"))
+
+
+@pytest.mark.django_db
+def test_account_tabs_price_multi_seat_items_from_leading_proxies(client):
+    from auctions.models import ProxyBid
+    from auctions.views import _proxy_state
+
+    a = Auction.objects.create(year=2029, slug="auction-2029", title="Auction 2029")
+    me = User.objects.create_user(email="me2@example.org", password="p")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_GOOD, slug="dinner", title="Dinner",
+        status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"), quantity_total=3,
+    )
+    for n, (amount, seats) in enumerate([(60, 2), (50, 2), (40, 1), (35, 3)]):
+        rival = User.objects.create_user(email=f"r{n}@example.org", password="p")
+        ProxyBid.objects.create(item=item, bidder=rival, max_amount=Decimal(amount), seats=seats)
+    ProxyBid.objects.create(item=item, bidder=me, max_amount=Decimal("20.00"), seats=2)
+    client.force_login(me)
+
+    all_rows = ProxyBid.objects.filter(item=item).values_list("max_amount", "updated_at", "bidder_id", "seats")
+    _, expected_price, _, _ = _proxy_state(item, all_rows)
+    [outbid] = client.get(reverse("auctions:account_tab_outbid")).context["items"]
+    assert (outbid.current_price, outbid.my_max) == (expected_price, Decimal("20.00"))
+    assert expected_price == Decimal("50.00")
+
+
+@pytest.mark.django_db
+def test_item_detail_counts_requested_seats(client, django_assert_num_queries):
+    from auctions.models import ProxyBid
+
+    a = Auction.objects.create(year=2030, slug="auction-2030", title="Auction 2030")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_EVENT, slug="tasting", title="Tasting",
+        status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"), quantity_total=4,
+    )
+    for n, seats in enumerate([2, 0]):
+        bidder = User.objects.create_user(email=f"s{n}@example.org", password="p")
+        ProxyBid.objects.create(item=item, bidder=bidder, max_amount=Decimal("12.00"), seats=seats)
+
+    # The seat total comes back with the item row
+    with django_assert_num_queries(1):
+        resp = client.get(reverse("auctions:item_detail", kwargs={"slug": item.slug}))
+    # A zero-seat proxy still asks for one seat
+    assert (resp.context["bid_seats_total"], resp.context["bid_seats_available"]) == (4, 1)
+
+
+@pytest.mark.django_db
+def test_lower_proxy_max_from_account_page_changes_nothing(client, django_assert_max_num_queries):
+    from auctions.models import ProxyBid
+
+    a = Auction.objects.create(year=2031, slug="auction-2031", title="Auction 2031")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_GOOD, slug="kayak", title="Kayak",
+        status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"),
+    )
+    user = User.objects.create_user(email="e@example.org", password="p")
+    client.force_login(user)
+    url = reverse("auctions:account_update_proxy_max", kwargs={"slug": item.slug})
+    client.post(url, {"amount": "40.00"})
+    proxy = ProxyBid.objects.get(item=item, bidder=user)
+
+    # Session, user, item and the user's current max; no locked re-pricing
+    with django_assert_max_num_queries(5):
+        client.post(url, {"amount": "30.00"})
+    proxy.refresh_from_db()
+    assert proxy.max_amount == Decimal("40.00")
+    assert Bid.objects.filter(item=item).count() == 1
+
+
+@pytest.mark.django_db
+def test_htmx_proxy_update_leaves_no_stale_flash(client):
+    a = Auction.objects.create(year=2032, slug="auction-2032", title="Auction 2032")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_GOOD, slug="easel", title="Easel",
+        status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"),
+    )
+    user = User.objects.create_user(email="f@example.org", password="p")
+    client.force_login(user)
+
+    resp = client.post(
+        reverse("auctions:account_update_proxy_max", kwargs={"slug": item.slug}), {"amount": "15.00"},
+        HTTP_HX_REQUEST="true",
+    )
+    assert [it.slug for it in resp.context["items"]] == ["easel"]
+    # Nothing queued to pop up on the next full page
+    assert list(client.get(reverse("auctions:account_home")).context["messages"]) == []
+
+
+@pytest.mark.django_db
+def test_htmx_resubmitted_proxy_max_refreshes_tab_without_writes(client, django_assert_num_queries):
+    from auctions.models import ProxyBid
+
+    a = Auction.objects.create(year=2033, slug="auction-2033", title="Auction 2033")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_GOOD, slug="canoe", title="Canoe",
+        status=Item.STATUS_PUBLISHED, opening_min_bid=Decimal("10.00"),
+    )
+    user = User.objects.create_user(email="g@example.org", password="p")
+    client.force_login(user)
+    url = reverse("auctions:account_update_proxy_max", kwargs={"slug": item.slug})
+    client.post(url, {"amount": "40.00"}, HTTP_HX_REQUEST="true")
+    proxy = ProxyBid.objects.get(item=item, bidder=user)
+
+    # User, item and the user's max, then one items and one proxies query for the tab
+    with django_assert_num_queries(5):
+        resp = client.post(url, {"amount": "40.00"}, HTTP_HX_REQUEST="true")
+    assert resp.status_code == 200
+    assert [it.slug for it in resp.context["items"]] == ["canoe"]
+    refreshed = ProxyBid.objects.get(pk=proxy.pk)
+    assert (refreshed.max_amount, refreshed.updated_at) == (proxy.max_amount, proxy.updated_at)
+    assert Bid.objects.filter(item=item).count() == 1
+    assert list(client.get(reverse("auctions:account_home")).context["messages"]) == []
+
+
+@pytest.mark.django_db
+def test_admin_proxy_edit_and_delete(client):
+    from auctions.models import ProxyBid
+
+    a = Auction.objects.create(year=2034, slug="auction-2034", title="Auction 2034")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_GOOD, slug="oar", title="Oar", status=Item.STATUS_PUBLISHED,
+    )
+    bidder = User.objects.create_user(email="h@example.org", password="p")
+    proxy = ProxyBid.objects.create(item=item, bidder=bidder, max_amount=Decimal("20.00"))
+    client.force_login(User.objects.create_superuser(email="admin@example.org", password="p"))
+
+    resp = client.post(
+        reverse("admin:auctions_proxybid_change", args=[proxy.pk]),
+        {"item": item.pk, "bidder": bidder.pk, "max_amount": "35.00", "seats": 1},
+    )
+    assert resp.status_code == 302
+    proxy.refresh_from_db()
+    assert proxy.max_amount == Decimal("35.00")
+
+    client.post(
+        reverse("admin:auctions_proxybid_changelist"),
+        {"action": "delete_selected", "_selected_action": [proxy.pk], "post": "yes"},
+    )
+    assert not ProxyBid.objects.filter(pk=proxy.pk).exists()
@@ -109,3 +109,20 @@ def test_validations_enforced_by_type(client, base_data):
     assert resp2.status_code == 200
     c2 = resp2.content.decode()
     assert "Required for fixed price items." in c2
+
+
+@pytest.mark.django_db
+def test_offered_tab_lists_donor_items(client, base_data, django_assert_max_num_queries):
+    a, cat = base_data
+    donor = User.objects.create_user(email="giver@example.org", password="p")
+    for n in range(3):
+        Item.objects.create(
+            auction=a, category=cat, donor=donor, type=Item.TYPE_EVENT, slug=f"gift-{n}", title=f"Gift {n}",
+            description="d" * 2000,
+        )
+    client.force_login(donor)
+    # Narrow rows, but no follow-up query for any column the tab renders
+    with django_assert_max_num_queries(3):
+        resp = client.get(reverse("auctions:account_tab_offered"))
+    body = resp.content.decode()
+    assert all(f"Gift {n}" in body for n in range(3)) and "Events" in body
@@ -1,80 +1,77 @@
 import pytest
-from decimal import Decimal
 from django.urls import reverse
-from django.contrib.auth import get_user_model
 
-from auctions.models import Auction, Category, Item, Signup
+from auctions.models import Signup
 
-User = get_user_model()
+
+def _waitlisted_by_user(item):
+    """{user_id: waitlisted} for every signup on the item, in one query."""
+    return dict(Signup.objects.filter(item=item).values_list("user_id", "waitlisted"))
 
 
 @pytest.mark.django_db
-def test_fixed_price_capacity_and_waitlist(client):
-    a = Auction.objects.create(year=2027, slug="auction-2027", title="Auction 2027")
-    cat = Category.objects.create(name="Events", slug="events")
-    item = Item.objects.create(
-        auction=a,
-        category=cat,
-        type=Item.TYPE_FIXED_PRICE,
-        slug="cooking-class",
-        title="Cooking Class",
-        status=Item.STATUS_PUBLISHED,
-        buy_now_price=Decimal("25.00"),
-        quantity_total=2,
-        quantity_sold=0,
-    )
-
-    u1 = User.objects.create_user(username="u1@example.org", email="u1@example.org", password="p")
-    u2 = User.objects.create_user(username="u2@example.org", email="u2@example.org", password="p")
-    u3 = User.objects.create_user(username="u3@example.org", email="u3@example.org", password="p")
-
-    # first two signups confirmed
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), follow=True)
-    client.post(reverse("auctions:login"), {"email": u2.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), follow=True)
-    item.refresh_from_db()
-    assert item.quantity_sold == 2
-    assert Signup.objects.filter(item=item, waitlisted=False).count() == 2
-
-    # third is waitlisted
-    client.post(reverse("auctions:login"), {"email": u3.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), follow=True)
-    assert Signup.objects.filter(item=item, waitlisted=True).count() == 1
+@pytest.mark.parametrize(
+    "capacity,quantities,expected_waitlisted,expected_sold",
+    [
+        (2, [1, 1, 1], [False, False, True], 2),
+        (1, [1, 1], [False, True], 1),
+        # a request that does not fit is waitlisted whole; a later smaller one still fits
+        (3, [2, 2, 1], [False, True, False], 3),
+    ],
+)
+def test_fixed_price_capacity_and_waitlist(
+    client, fp_item, make_users, capacity, quantities, expected_waitlisted, expected_sold
+):
+    item = fp_item("cooking-class", "Cooking Class", quantity_total=capacity, price="25.00")
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    users = make_users(*(f"u{n}@example.org" for n in range(1, len(quantities) + 1)))
+
+    for user, qty in zip(users, quantities):
+        client.force_login(user)
+        client.post(signup_url, {"quantity": qty})
+
+    item.refresh_from_db(fields=["quantity_sold"])
+    assert item.quantity_sold == expected_sold
+    assert _waitlisted_by_user(item) == {u.pk: w for u, w in zip(users, expected_waitlisted)}
 
 
 @pytest.mark.django_db
-def test_cancel_promotes_waitlist(client):
-    a = Auction.objects.create(year=2028, slug="auction-2028", title="Auction 2028")
-    cat = Category.objects.create(name="Events", slug="events")
-    item = Item.objects.create(
-        auction=a,
-        category=cat,
-        type=Item.TYPE_FIXED_PRICE,
-        slug="wine-night",
-        title="Wine Night",
-        status=Item.STATUS_PUBLISHED,
-        buy_now_price=Decimal("30.00"),
-        quantity_total=1,
-        quantity_sold=0,
-    )
-    u1 = User.objects.create_user(username="u1x@example.org", email="u1x@example.org", password="p")
-    u2 = User.objects.create_user(username="u2x@example.org", email="u2x@example.org", password="p")
+def test_cancel_promotes_waitlist(client, fp_item, make_users, django_assert_max_num_queries):
+    item = fp_item("wine-night", "Wine Night", quantity_total=1, price="30.00")
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    cancel_url = reverse("auctions:fixed_price_cancel", kwargs={"slug": item.slug})
+    u1, u2 = make_users("u1x@example.org", "u2x@example.org")
 
     # u1 confirmed, u2 waitlisted
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}))
-    client.post(reverse("auctions:login"), {"email": u2.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}))
+    client.force_login(u1)
+    client.post(signup_url)
+    client.force_login(u2)
+    client.post(signup_url)
 
-    assert Signup.objects.filter(item=item, waitlisted=False).count() == 1
-    assert Signup.objects.filter(item=item, waitlisted=True).count() == 1
+    assert _waitlisted_by_user(item) == {u1.pk: False, u2.pk: True}
 
-    # u1 cancels -> u2 promoted
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_cancel", kwargs={"slug": item.slug}), follow=True)
+    # u1 cancels -> u2 promoted; promotion is a fixed number of queries
+    client.force_login(u1)
+    with django_assert_max_num_queries(8):
+        client.post(cancel_url)
 
-    item.refresh_from_db()
+    item.refresh_from_db(fields=["quantity_sold"])
     assert item.quantity_sold == 1
-    assert Signup.objects.filter(item=item, waitlisted=False, user=u2).exists()
-    assert not Signup.objects.filter(item=item, waitlisted=True).exists()
+    assert _waitlisted_by_user(item) == {u2.pk: False}
+
+
+@pytest.mark.django_db
+def test_htmx_signup_and_cancel_render_partial(client, fp_item, make_users):
+    item = fp_item("garden-tour", "Garden Tour", quantity_total=3)
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    cancel_url = reverse("auctions:fixed_price_cancel", kwargs={"slug": item.slug})
+    (u1,) = make_users("u1h@example.org")
+    client.force_login(u1)
+
+    resp = client.post(signup_url, {"quantity": "2"}, HTTP_HX_REQUEST="true")
+    assert resp.status_code == 200
+    assert resp.context["spots_left"] == 1 and resp.context["user_signup"].quantity == 2
+
+    resp = client.post(cancel_url, HTTP_HX_REQUEST="true")
+    assert resp.status_code == 200
+    assert resp.context["spots_left"] == 3 and resp.context["user_signup"] is None
@@ -1,167 +1,181 @@
 import pytest
-from decimal import Decimal
 from django.urls import reverse
-from django.contrib.auth import get_user_model
 
-from auctions.models import Auction, Category, Item, Signup
-
-User = get_user_model()
+from auctions.models import Signup
 
 
 @pytest.mark.django_db
-def test_multi_quantity_signup_and_adjust_increase_within_capacity(client):
-    a = Auction.objects.create(year=2029, slug="auction-2029", title="Auction 2029")
-    cat = Category.objects.create(name="Events", slug="events")
-    item = Item.objects.create(
-        auction=a,
-        category=cat,
-        type=Item.TYPE_FIXED_PRICE,
-        slug="picnic",
-        title="Picnic",
-        status=Item.STATUS_PUBLISHED,
-        buy_now_price=Decimal("10.00"),
-        quantity_total=5,
-        quantity_sold=0,
-    )
-    u = User.objects.create_user(username="u@example.org", email="u@example.org", password="p")
+def test_multi_quantity_signup_and_adjust_increase_within_capacity(client, fp_item, make_users):
+    item = fp_item("picnic", "Picnic", quantity_total=5, price="10.00")
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    adjust_url = reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug})
+    (u,) = make_users("u@example.org")
 
     # signup for 2 seats
-    client.post(reverse("auctions:login"), {"email": u.email, "password": "p"})
-    client.post(
-        reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}),
-        {"quantity": 2},
-        follow=True,
-    )
-    item.refresh_from_db()
+    client.force_login(u)
+    client.post(signup_url, {"quantity": 2}, follow=True)
+    item.refresh_from_db(fields=["quantity_sold"])
     s = Signup.objects.get(item=item, user=u)
     assert not s.waitlisted and s.quantity == 2
     assert item.quantity_sold == 2
 
     # increase to 4 (within capacity)
-    client.post(
-        reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug}),
-        {"quantity": 4},
-        follow=True,
-    )
-    item.refresh_from_db()
-    s.refresh_from_db()
+    client.post(adjust_url, {"quantity": 4}, follow=True)
+    item.refresh_from_db(fields=["quantity_sold"])
+    s.refresh_from_db(fields=["quantity", "waitlisted"])
     assert s.quantity == 4
     assert item.quantity_sold == 4
 
 
 @pytest.mark.django_db
-def test_adjust_increase_beyond_capacity_fails(client):
-    a = Auction.objects.create(year=2030, slug="auction-2030", title="Auction 2030")
-    cat = Category.objects.create(name="Events", slug="events")
-    item = Item.objects.create(
-        auction=a,
-        category=cat,
-        type=Item.TYPE_FIXED_PRICE,
-        slug="yoga",
-        title="Yoga",
-        status=Item.STATUS_PUBLISHED,
-        buy_now_price=Decimal("12.00"),
-        quantity_total=3,
-        quantity_sold=0,
-    )
-    u1 = User.objects.create_user(username="u1@example.org", email="u1@example.org", password="p")
-    u2 = User.objects.create_user(username="u2@example.org", email="u2@example.org", password="p")
-
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 2})
-    client.post(reverse("auctions:login"), {"email": u2.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 1})
-
-    item.refresh_from_db()
+def test_adjust_increase_beyond_capacity_fails(client, fp_item, make_users):
+    item = fp_item("yoga", "Yoga", quantity_total=3, price="12.00")
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    adjust_url = reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug})
+    u1, u2 = make_users("u1@example.org", "u2@example.org")
+
+    client.force_login(u1)
+    client.post(signup_url, {"quantity": 2})
+    client.force_login(u2)
+    client.post(signup_url, {"quantity": 1})
+
+    item.refresh_from_db(fields=["quantity_sold"])
     s1 = Signup.objects.get(item=item, user=u1)
     assert item.quantity_sold == 3 and not s1.waitlisted
 
     # u1 tries to increase to 3 (needs +1) but capacity is full -> stays 2
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug}), {"quantity": 3})
+    client.force_login(u1)
+    client.post(adjust_url, {"quantity": 3})
 
-    item.refresh_from_db(); s1.refresh_from_db()
+    item.refresh_from_db(fields=["quantity_sold"])
+    s1.refresh_from_db(fields=["quantity", "waitlisted"])
     assert s1.quantity == 2
     assert item.quantity_sold == 3
 
 
 @pytest.mark.django_db
-def test_adjust_decrease_promotes_waitlist_fifo(client):
-    a = Auction.objects.create(year=2031, slug="auction-2031", title="Auction 2031")
-    cat = Category.objects.create(name="Events", slug="events")
-    item = Item.objects.create(
-        auction=a,
-        category=cat,
-        type=Item.TYPE_FIXED_PRICE,
-        slug="dinner",
-        title="Dinner",
-        status=Item.STATUS_PUBLISHED,
-        buy_now_price=Decimal("20.00"),
-        quantity_total=4,
-        quantity_sold=0,
-    )
-    u1 = User.objects.create_user(username="u1@example.org", email="u1@example.org", password="p")
-    u2 = User.objects.create_user(username="u2@example.org", email="u2@example.org", password="p")
-    u3 = User.objects.create_user(username="u3@example.org", email="u3@example.org", password="p")
-
-    # u1 confirmed for 3, u2 confirmed for 1 -> full
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 3})
-    client.post(reverse("auctions:login"), {"email": u2.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 1})
-    item.refresh_from_db(); assert item.quantity_sold == 4
+def test_adjust_decrease_promotes_waitlist_fifo(client, fp_item, make_users, django_assert_max_num_queries):
+    item = fp_item("dinner", "Dinner", quantity_total=4, price="20.00")
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    adjust_url = reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug})
+    cancel_url = reverse("auctions:fixed_price_cancel", kwargs={"slug": item.slug})
+    u1, u2, u3 = make_users("u1@example.org", "u2@example.org", "u3@example.org")
+
+    # given: u1 confirmed for 3, u2 confirmed for 1 -> full (rows written directly)
+    Signup.objects.bulk_create([Signup(item=item, user=u1, quantity=3), Signup(item=item, user=u2, quantity=1)])
+    item.quantity_sold = 4
+    item.save(update_fields=["quantity_sold"])
 
     # u3 requests 2 -> waitlisted
-    client.post(reverse("auctions:login"), {"email": u3.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 2})
+    client.force_login(u3)
+    client.post(signup_url, {"quantity": 2})
     w3 = Signup.objects.get(item=item, user=u3)
     assert w3.waitlisted and w3.quantity == 2
 
     # u1 decreases from 3 to 2 -> frees 1 seat, not enough to promote w3 (needs 2)
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug}), {"quantity": 2})
-    item.refresh_from_db(); w3.refresh_from_db()
+    client.force_login(u1)
+    with django_assert_max_num_queries(8):
+        client.post(adjust_url, {"quantity": 2})
+    item.refresh_from_db(fields=["quantity_sold"])
+    w3.refresh_from_db(fields=["quantity", "waitlisted"])
     assert item.quantity_sold == 3
     assert w3.waitlisted
 
     # u2 cancels -> frees 1 more seat -> now promote w3 (needs 2 total, now available)
-    client.post(reverse("auctions:login"), {"email": u2.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_cancel", kwargs={"slug": item.slug}))
+    client.force_login(u2)
+    with django_assert_max_num_queries(9):
+        client.post(cancel_url)
 
-    item.refresh_from_db(); w3.refresh_from_db()
+    item.refresh_from_db(fields=["quantity_sold"])
+    w3.refresh_from_db(fields=["quantity", "waitlisted"])
     assert not w3.waitlisted
     assert item.quantity_sold == 4
 
 
 @pytest.mark.django_db
-def test_waitlisted_user_adjusts_quantity_only_updates_record(client):
-    a = Auction.objects.create(year=2032, slug="auction-2032", title="Auction 2032")
-    cat = Category.objects.create(name="Events", slug="events")
-    item = Item.objects.create(
-        auction=a,
-        category=cat,
-        type=Item.TYPE_FIXED_PRICE,
-        slug="coding",
-        title="Coding",
-        status=Item.STATUS_PUBLISHED,
-        buy_now_price=Decimal("15.00"),
-        quantity_total=1,
-        quantity_sold=0,
+def test_waitlisted_user_adjusts_quantity_only_updates_record(client, fp_item, make_users):
+    item = fp_item("coding", "Coding", quantity_total=1, price="15.00")
+    adjust_url = reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug})
+    u1, u2 = make_users("u1@example.org", "u2@example.org")
+
+    # given: u1 confirmed, u2 waitlisted for 2 (rows written directly)
+    _, w2 = Signup.objects.bulk_create(
+        [Signup(item=item, user=u1, quantity=1), Signup(item=item, user=u2, quantity=2, waitlisted=True)]
     )
-    u1 = User.objects.create_user(username="u1@example.org", email="u1@example.org", password="p")
-    u2 = User.objects.create_user(username="u2@example.org", email="u2@example.org", password="p")
-
-    # u1 confirmed, u2 waitlisted for 2
-    client.post(reverse("auctions:login"), {"email": u1.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 1})
-    client.post(reverse("auctions:login"), {"email": u2.email, "password": "p"})
-    client.post(reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 2})
-
-    w2 = Signup.objects.get(item=item, user=u2)
-    assert w2.waitlisted and w2.quantity == 2
+    item.quantity_sold = 1
+    item.save(update_fields=["quantity_sold"])
 
     # u2 adjusts to 1; still waitlisted; item sold unchanged
-    client.post(reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug}), {"quantity": 1})
-    item.refresh_from_db(); w2.refresh_from_db()
+    client.force_login(u2)
+    client.post(adjust_url, {"quantity": 1})
+    item.refresh_from_db(fields=["quantity_sold"])
+    w2.refresh_from_db(fields=["quantity", "waitlisted"])
     assert w2.waitlisted and w2.quantity == 1
     assert item.quantity_sold == 1
+
+
+@pytest.mark.django_db
+def test_promotion_skips_waitlisted_request_that_does_not_fit(client, fp_item, make_users):
+    item = fp_item("pottery", "Pottery", quantity_total=2)
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    adjust_url = reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug})
+    u1, u2, u3 = make_users("u1@example.org", "u2@example.org", "u3@example.org")
+
+    for user, qty in ((u1, 2), (u2, 2), (u3, 1)):
+        client.force_login(user)
+        client.post(signup_url, {"quantity": qty})
+
+    # u1 frees one seat: u2 (needs 2) stays waitlisted, the later u3 (needs 1) is promoted
+    client.force_login(u1)
+    client.post(adjust_url, {"quantity": 1})
+
+    item.refresh_from_db(fields=["quantity_sold"])
+    assert item.quantity_sold == 2
+    signups = {s.user_id: s for s in Signup.objects.filter(item=item, user__in=[u2, u3])}
+    assert signups[u2.pk].waitlisted and not signups[u3.pk].waitlisted
+
+
+@pytest.mark.django_db
+def test_htmx_adjust_failure_renders_pre_request_state(client, fp_item, make_users, monkeypatch):
+    item = fp_item("choir", "Choir", quantity_total=5)
+    signup_url = reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug})
+    adjust_url = reverse("auctions:fixed_price_adjust", kwargs={"slug": item.slug})
+    (u1,) = make_users("u1@example.org")
+    client.force_login(u1)
+    client.post(signup_url, {"quantity": 3})
+
+    def boom(item, remaining):
+        raise RuntimeError("promotion failed")
+
+    monkeypatch.setattr("auctions.views._promote_waitlist", boom)
+    resp = client.post(adjust_url, {"quantity": 1}, HTTP_HX_REQUEST="true")
+    # The decrease was rolled back, and the partial shows the rows as they were
+    assert resp.context["user_signup"].quantity == 3 and resp.context["spots_left"] == 2
+    item.refresh_from_db(fields=["quantity_sold"])
+    assert item.quantity_sold == 3
+    assert Signup.objects.get(item=item, user=u1).quantity == 3
+
+
+@pytest.mark.django_db
+def test_htmx_signup_integrity_error_rereads_state(client, fp_item, make_users, monkeypatch):
+    from django.db import IntegrityError
+
+    from auctions import views
+
+    item = fp_item("kiln", "Kiln", quantity_total=4)
+    (u1,) = make_users("u1@example.org")
+    client.force_login(u1)
+
+    def lost_race(item, delta):
+        raise IntegrityError("uniq_signup_item_user")
+
+    reads = []
+    load = views._load_signup_state
+    monkeypatch.setattr("auctions.views._shift_quantity_sold", lost_race)
+    monkeypatch.setattr("auctions.views._load_signup_state", lambda *a: reads.append(a) or load(*a))
+    resp = client.post(
+        reverse("auctions:fixed_price_signup", kwargs={"slug": item.slug}), {"quantity": 1}, HTTP_HX_REQUEST="true"
+    )
+    # Another transaction's rows would be missing from the locked copies, so the partial re-reads
+    assert len(reads) == 1
+    assert resp.context["user_signup"] is None and resp.context["spots_left"] == 4
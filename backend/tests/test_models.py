@@ -1,9 +1,14 @@
 import pytest
 from django.core.exceptions import ValidationError
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.db import IntegrityError, transaction
 from django.utils.text import slugify
 
-from auctions.models import Auction, Category, Item
+from auctions.models import Auction, Bid, Category, Item, Signup
 
 
 @pytest.mark.django_db
@@ -61,3 +66,94 @@ def test_item_unique_slug_constraint():
     Item.objects.create(auction=a, category=cat, type=Item.TYPE_GOOD, slug="dupe", title="One")
     with pytest.raises(IntegrityError):
         Item.objects.create(auction=a, category=cat, type=Item.TYPE_GOOD, slug="dupe", title="Two")
+
+
+@pytest.mark.django_db
+def test_item_bid_counters_follow_bids():
+    a = Auction.objects.create(year=2028, slug="auction-2028", title="TVUUC Auction 2028")
+    item = Item.objects.create(auction=a, type=Item.TYPE_GOOD, slug="lamp", title="Lamp")
+    user = get_user_model().objects.create_user(email="bidder@example.org", password="x")
+    stale = Item.objects.get(pk=item.pk)
+
+    Bid.objects.create(item=item, bidder=user, amount=Decimal("10"))
+    top = Bid.objects.create(item=item, bidder=user, amount=Decimal("15"))
+    item.refresh_from_db()
+    assert (item.current_bid_amount, item.bid_count) == (Decimal("15"), 2)
+
+    # A full save of an instance loaded before the bids keeps the counters
+    stale.title = "Desk lamp"
+    stale.save()
+    item.refresh_from_db()
+    assert (item.title, item.current_bid_amount, item.bid_count) == ("Desk lamp", Decimal("15"), 2)
+
+    top.delete()
+    item.refresh_from_db()
+    assert (item.current_bid_amount, item.bid_count) == (Decimal("10"), 1)
+
+
+@pytest.mark.django_db
+def test_reconcile_item_counters_repairs_drift():
+    a = Auction.objects.create(year=2029, slug="auction-2029", title="TVUUC Auction 2029")
+    user = get_user_model().objects.create_user(email="bidder@example.org", password="x")
+    items = [
+        Item.objects.create(auction=a, type=Item.TYPE_GOOD, slug=f"item-{n}", title=f"Item {n}")
+        for n in range(3)
+    ]
+    Bid.objects.create(item=items[0], bidder=user, amount=Decimal("12"))
+    Item.objects.filter(pk__in=[items[0].pk, items[2].pk]).update(current_bid_amount=Decimal("99"), bid_count=7)
+
+    out = StringIO()
+    call_command("reconcile_item_counters", "--chunk-size", "2", stdout=out)
+    assert "Checked 3 items; 2 fixed." in out.getvalue()
+    counters = dict(Item.objects.values_list("slug", "bid_count"))
+    assert counters == {"item-0": 1, "item-1": 0, "item-2": 0}
+    assert Item.objects.get(pk=items[0].pk).current_bid_amount == Decimal("12")
+
+
+@pytest.mark.django_db
+def test_reconcile_item_counters_repairs_quantity_sold():
+    a = Auction.objects.create(year=2030, slug="auction-2030", title="TVUUC Auction 2030")
+    item = Item.objects.create(
+        auction=a, type=Item.TYPE_FIXED_PRICE, slug="dinner", title="Dinner", quantity_total=6, quantity_sold=5
+    )
+    users = [get_user_model().objects.create_user(email=f"u{n}@example.org", password="x") for n in range(2)]
+    Signup.objects.create(item=item, user=users[0], quantity=2)
+    Signup.objects.create(item=item, user=users[1], quantity=4, waitlisted=True)
+
+    out = StringIO()
+    call_command("reconcile_item_counters", stdout=out)
+    assert "Checked 1 items; 1 fixed." in out.getvalue()
+    item.refresh_from_db()
+    assert item.quantity_sold == 2
+
+
+@pytest.mark.django_db
+def test_end_live_phase_lists_top_bid_per_item():
+    a = Auction.objects.create(year=2031, slug="auction-2031", title="TVUUC Auction 2031")
+    users = [get_user_model().objects.create_user(email=f"b{n}@example.org", password="x") for n in range(2)]
+    kayak, lamp = (
+        Item.objects.create(auction=a, type=Item.TYPE_GOOD, slug=s, title=s.title(), status=Item.STATUS_PUBLISHED)
+        for s in ("kayak", "lamp")
+    )
+    Bid.objects.create(item=kayak, bidder=users[0], amount=Decimal("40"))
+    Bid.objects.create(item=kayak, bidder=users[1], amount=Decimal("55"))
+
+    out = StringIO()
+    call_command("end_live_phase", "--auction", "2031", "--verbose-items", "--dry-run", stdout=out)
+    output = out.getvalue()
+    assert "WIN: Kayak -> SOLD at 55" in output
+    assert "NO BIDS: Lamp" in output
+    assert "Summary: 1 to mark SOLD, 1 remain PUBLISHED" in output
+
+
+@pytest.mark.django_db
+def test_current_auction_id_is_cached_until_an_auction_changes(django_assert_num_queries):
+    a = Auction.objects.create(year=2031, slug="auction-2031", title="TVUUC Auction 2031")
+    assert Auction.current_id() == a.pk
+    with django_assert_num_queries(0):
+        assert Auction.current_id() == a.pk
+
+    newer = Auction.objects.create(year=2032, slug="auction-2032", title="TVUUC Auction 2032")
+    assert Auction.current_id() == newer.pk
+    newer.delete()
+    assert Auction.current_id() == a.pk
@@ -1,7 +1,6 @@
 import pytest
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from django.core.management import call_command
 
 from auctions.models import Auction, Category, Item
 
@@ -30,7 +29,6 @@ def base_objects():
 
 @pytest.mark.django_db
 def test_only_manager_can_publish(client, base_objects):
-    call_command("bootstrap_roles")
     a, cat, donor, item = base_objects
 
     # donor cannot publish
@@ -55,7 +53,6 @@ def test_only_manager_can_publish(client, base_objects):
 
 @pytest.mark.django_db
 def test_donor_cannot_edit_after_publish(client, base_objects):
-    call_command("bootstrap_roles")
     a, cat, donor, item = base_objects
     # publish as manager
     manager = User.objects.create_user(username="m2@example.org", email="m2@example.org", password="p")
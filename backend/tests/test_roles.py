@@ -35,7 +35,6 @@ def test_bootstrap_roles_creates_groups_and_permissions():
 
 @pytest.mark.django_db
 def test_register_adds_user_to_donor_group(client):
-    call_command("bootstrap_roles")
     # Register
     resp = client.post(
         reverse("auctions:register"),
@@ -55,9 +54,6 @@ def test_register_adds_user_to_donor_group(client):
 
 @pytest.mark.django_db
 def test_manager_views_access_control(client, django_user_model):
-    # Ensure roles exist
-    call_command("bootstrap_roles")
-
     # Create users
     user = django_user_model.objects.create_user(email="user@example.org", password="pw12345")
     manager = django_user_model.objects.create_user(email="manager@example.org", password="pw12345")
@@ -12,3 +12,121 @@ def test_health(client):
 def test_catalog_home(client):
     resp = client.get("/")
     assert resp.status_code == 200
+
+
+@pytest.mark.django_db
+def test_catalog_cards_show_description_excerpt(client, django_assert_max_num_queries):
+    from auctions.models import Auction, Category, Item
+
+    a = Auction.objects.create(year=2031, slug="auction-2031", title="Auction 2031")
+    cat = Category.objects.create(name="Goods", slug="goods")
+    for n in range(3):
+        Item.objects.create(
+            auction=a, category=cat, type=Item.TYPE_GOOD, slug=f"quilt-{n}", title=f"Quilt {n}",
+            status=Item.STATUS_PUBLISHED, description="Hand-stitched " + "x" * 300,
+        )
+    # One query for categories and one for their items, however many cards render
+    with django_assert_max_num_queries(4):
+        resp = client.get(reverse("auctions:catalog_list"))
+    body = resp.content.decode()
+    assert "Hand-stitched" in body and "x" * 200 not in body
+    resp = client.get(reverse("auctions:catalog_list"), {"q": "stitched"})
+    assert resp.context["results_count"] == 3
+
+
+@pytest.mark.django_db
+def test_catalog_pages_each_category_by_keyset(client, monkeypatch):
+    from auctions.models import Auction, Category, Item
+
+    monkeypatch.setattr("auctions.views.CATALOG_PAGE_SIZE", 2)
+    a = Auction.objects.create(year=2032, slug="auction-2032", title="Auction 2032")
+    cat = Category.objects.create(name="Art", slug="art")
+    for title in ("Bowl", "Anchor", "Canvas", "Canvas"):
+        Item.objects.create(
+            auction=a, category=cat, type=Item.TYPE_GOOD, slug=f"{title.lower()}-{Item.objects.count()}",
+            title=title, status=Item.STATUS_PUBLISHED,
+        )
+
+    resp = client.get(reverse("auctions:catalog_list"))
+    (shown,) = resp.context["categories"]
+    assert [i.title for i in shown.published_items] == ["Anchor", "Bowl"] and shown.has_more
+
+    seen = []
+    after = shown.next_after
+    while after:
+        resp = client.get(reverse("auctions:catalog_list"), {"category": "art", "after": after})
+        (page,) = resp.context["categories"]
+        seen += [i.title for i in page.published_items]
+        after = getattr(page, "next_after", None) if page.has_more else None
+    assert seen == ["Canvas", "Canvas"]
+
+
+@pytest.mark.django_db
+def test_catalog_search_matches_item_text_and_category_name(client):
+    from auctions.models import Auction, Category, Item
+
+    a = Auction.objects.create(year=2033, slug="auction-2033", title="Auction 2033")
+    pottery = Category.objects.create(name="Pottery", slug="pottery")
+    travel = Category.objects.create(name="Travel", slug="travel")
+    Item.objects.create(
+        auction=a, category=pottery, type=Item.TYPE_GOOD, slug="mug", title="Mug",
+        status=Item.STATUS_PUBLISHED,
+    )
+    Item.objects.create(
+        auction=a, category=travel, type=Item.TYPE_GOOD, slug="cabin", title="Lake cabin weekend",
+        status=Item.STATUS_PUBLISHED, restrictions="Blackout dates apply",
+    )
+
+    def titles(q):
+        resp = client.get(reverse("auctions:catalog_list"), {"q": q})
+        return sorted(i.title for c in resp.context["categories"] for i in c.published_items)
+
+    assert titles("pottery") == ["Mug"]
+    resp = client.get(reverse("auctions:catalog_list"), {"q": "blackout"})
+    assert [c.slug for c in resp.context["categories"]] == ["travel"]
+    assert titles("blackout") == ["Lake cabin weekend"]
+    assert titles("cabin") == ["Lake cabin weekend"]
+    assert titles("cab") == ["Lake cabin weekend"]
+
+
+@pytest.mark.django_db
+def test_catalog_search_counts_results_without_count_query(client, monkeypatch):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from auctions.models import Auction, Category, Item
+
+    a = Auction.objects.create(year=2034, slug="auction-2034", title="Auction 2034")
+    cat = Category.objects.create(name="Art", slug="art")
+    for n in range(3):
+        Item.objects.create(
+            auction=a, category=cat, type=Item.TYPE_GOOD, slug=f"print-{n}", title=f"Print {n}",
+            status=Item.STATUS_PUBLISHED,
+        )
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(reverse("auctions:catalog_list"), {"q": "print"})
+    assert resp.context["results_count"] == 3
+    assert not any("COUNT(" in q["sql"].upper() for q in ctx.captured_queries)
+
+    # A truncated category still reports the full total
+    monkeypatch.setattr("auctions.views.CATALOG_PAGE_SIZE", 2)
+    resp = client.get(reverse("auctions:catalog_list"), {"q": "print"})
+    assert resp.context["results_count"] == 3
+
+
+@pytest.mark.django_db
+def test_admin_item_search_matches_description_and_restrictions(client, django_user_model):
+    from auctions.models import Auction, Item
+
+    a = Auction.objects.create(year=2035, slug="auction-2035", title="Auction 2035")
+    Item.objects.create(auction=a, type=Item.TYPE_GOOD, slug="quilt", title="Quilt", description="Hand-stitched")
+    Item.objects.create(auction=a, type=Item.TYPE_GOOD, slug="cabin", title="Cabin", restrictions="Blackout dates")
+    client.force_login(django_user_model.objects.create_superuser(email="admin@example.org", password="p"))
+
+    def found(q):
+        resp = client.get(reverse("admin:auctions_item_changelist"), {"q": q})
+        return [i.slug for i in resp.context["cl"].result_list]
+
+    assert found("stitched") == ["quilt"]
+    assert found("blackout") == ["cabin"]